@@ -4,33 +4,20 @@ Enhanced ReCAPTCHA debug script with maximum anti-detection measures.
 This script tests the improved stealth techniques against Google's bot detection.
 """
 
-import os
+import re
 import sys
 import time
+import random
 import logging
-from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+from selenium.webdriver.common.action_chains import ActionChains
 
 from iras_scraper.scraper import IRASScraper
 from iras_scraper.config import Config
+from iras_scraper._logging import configure as configure_logging, wait_for_inspection
 
-def setup_enhanced_logging():
-    """Setup enhanced logging for debugging."""
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('logs/enhanced_debug.log')
-        ]
-    )
-    
-    # Reduce selenium logging noise
-    logging.getLogger('selenium').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+# Fallback matcher for Google's automation warning when JS evaluation fails
+_AUTOMATED_QUERIES_RE = re.compile(r"automated queries", re.I)
 
 def test_enhanced_recaptcha_solving():
     """Test the enhanced ReCAPTCHA solving with maximum anti-detection."""
@@ -48,12 +35,12 @@ def test_enhanced_recaptcha_solving():
     try:
         # Initialize scraper with enhanced configuration
         logger.info("🚀 Initializing scraper with enhanced anti-detection...")
-        config = Config()
-        
         # Enable more aggressive stealth settings
-        config.HEADLESS = False  # Keep visible for debugging
-        config.RECAPTCHA_AUTO_SOLVE = True
-        config.RECAPTCHA_MAX_RETRIES = 3
+        config = Config(
+            HEADLESS=False,  # Keep visible for debugging
+            RECAPTCHA_AUTO_SOLVE=True,
+            RECAPTCHA_MAX_RETRIES=3
+        )
         
         scraper = IRASScraper(config)
         
@@ -85,10 +72,13 @@ def test_enhanced_recaptcha_solving():
                 
                 input_field.clear()
                 
-                # Type with realistic delays between characters
+                # Type one key at a time with a 0.1-0.2s pause after each,
+                # queued as a single ActionChains perform() so the pauses
+                # happen in the browser rather than as separate round trips
+                typing = ActionChains(scraper.driver).click(input_field)
                 for char in test_uen:
-                    input_field.send_keys(char)
-                    time.sleep(0.1 + (time.time() % 0.1))  # 0.1-0.2s per char
+                    typing.send_keys(char).pause(random.uniform(0.10, 0.20))
+                typing.perform()
                 
                 logger.info("✅ UEN entered with realistic timing")
                 
@@ -124,9 +114,14 @@ def test_enhanced_recaptcha_solving():
                 else:
                     logger.warning("⚠️  ReCAPTCHA solving unsuccessful - checking for detection messages...")
                     
-                    # Check for Google's automation detection message
-                    page_source = scraper.driver.page_source.lower()
-                    if "automated queries" in page_source:
+                    # Check for Google's automation detection message in the browser
+                    try:
+                        detected = scraper.driver.execute_script(
+                            "return /automated queries/i.test(document.body ? document.body.innerText : '')"
+                        )
+                    except Exception:
+                        detected = bool(_AUTOMATED_QUERIES_RE.search(scraper.driver.page_source))
+                    if detected:
                         logger.error("🚨 DETECTED: Google identified automated behavior!")
                         logger.error("📋 Message: 'Your computer or network may be sending automated queries'")
                         logger.info("💡 This indicates our anti-detection measures need further enhancement")
@@ -151,10 +146,8 @@ def test_enhanced_recaptcha_solving():
         logger.info("")
         logger.info("Press Ctrl+C to end the debugging session...")
         
-        try:
-            # Keep browser open for extended debugging
-            time.sleep(120)  # 2 minutes for inspection
-        except KeyboardInterrupt:
+        # Keep browser open for extended debugging (2 minutes for inspection)
+        if wait_for_inspection(120):
             logger.info("🛑 Debugging session interrupted by user")
         
         logger.info("🎯 Enhanced anti-detection test completed")
@@ -171,11 +164,8 @@ def test_enhanced_recaptcha_solving():
 
 def main():
     """Main function."""
-    # Ensure logs directory exists
-    os.makedirs('logs', exist_ok=True)
-    
-    # Setup logging
-    setup_enhanced_logging()
+    # Setup logging (also creates the logs directory)
+    configure_logging(logfile='logs/enhanced_debug.log', stream=sys.stdout)
     
     # Run the enhanced test
     test_enhanced_recaptcha_solving()
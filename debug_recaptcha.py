@@ -2,32 +2,22 @@
 """Debug script for ReCAPTCHA solver issues."""
 
 import logging
-import time
 from iras_scraper.scraper import IRASScraper
 from iras_scraper.config import Config
-
-def setup_debug_logging():
-    """Set up detailed logging for debugging."""
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('logs/debug_recaptcha.log')
-        ]
-    )
+from iras_scraper._logging import configure as configure_logging, wait_for_inspection
 
 def debug_recaptcha():
     """Debug ReCAPTCHA detection and solving."""
-    setup_debug_logging()
+    configure_logging(logfile='logs/debug_recaptcha.log')
     logger = logging.getLogger(__name__)
     
     logger.info("Starting ReCAPTCHA debug session")
     
     # Create config with debug settings
-    config = Config()
-    config.HEADLESS = False  # Keep browser visible for debugging
-    config.RECAPTCHA_AUTO_SOLVE = True
+    config = Config(
+        HEADLESS=False,  # Keep browser visible for debugging
+        RECAPTCHA_AUTO_SOLVE=True
+    )
     
     # Create scraper instance
     scraper = IRASScraper(config)
@@ -53,26 +43,21 @@ def debug_recaptcha():
         # Check for ReCAPTCHA
         logger.info("Checking for ReCAPTCHA elements...")
         
-        # Look for ReCAPTCHA iframes
-        from selenium.webdriver.common.by import By
-        recaptcha_frames = scraper.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha']")
-        logger.info(f"Found {len(recaptcha_frames)} ReCAPTCHA iframes")
+        # Collect iframes, containers and response tokens via the resident page probe
+        info = scraper._find_recaptcha()
+        recaptcha_frames = info["frames"]
+        recaptcha_containers = info["containers"]
+        response_tokens = info["tokens"]
         
-        for i, frame in enumerate(recaptcha_frames):
-            src = frame.get_attribute('src')
+        logger.info(f"Found {len(recaptcha_frames)} ReCAPTCHA iframes")
+        for i, src in enumerate(recaptcha_frames):
             logger.info(f"ReCAPTCHA iframe {i}: {src}")
         
-        # Look for ReCAPTCHA containers
-        recaptcha_containers = scraper.driver.find_elements(By.CSS_SELECTOR, ".g-recaptcha")
-        logger.info(f"Found {len(recaptcha_containers)} ReCAPTCHA containers")
-        
-        # Look for response tokens
-        response_elements = scraper.driver.find_elements(By.NAME, "g-recaptcha-response")
-        logger.info(f"Found {len(response_elements)} g-recaptcha-response elements")
+        logger.info(f"Found {recaptcha_containers} ReCAPTCHA containers")
         
-        for i, element in enumerate(response_elements):
-            value = element.get_attribute("value")
-            logger.info(f"Response element {i} value length: {len(value) if value else 0}")
+        logger.info(f"Found {len(response_tokens)} g-recaptcha-response elements")
+        for i, token_length in enumerate(response_tokens):
+            logger.info(f"Response element {i} value length: {token_length}")
         
         # Try to solve ReCAPTCHA if found
         if recaptcha_frames or recaptcha_containers:
@@ -96,7 +81,8 @@ def debug_recaptcha():
         # Keep browser open for manual inspection
         logger.info("Debug session complete. Browser will stay open for 60 seconds for manual inspection...")
         logger.info("You can use this time to verify ReCAPTCHA status or solve any remaining challenges.")
-        time.sleep(60)
+        if wait_for_inspection(60):
+            logger.info("Debug session interrupted by user")
         
     except Exception as e:
         logger.error(f"Error in debug session: {str(e)}", exc_info=True)
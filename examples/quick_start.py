@@ -4,15 +4,14 @@ IRAS Scraper - Quick Start Examples
 This file demonstrates the main ways to use the IRAS scraper package.
 """
 
-from iras_scraper import IRASScraper, ExcelHandler, Config
+from iras_scraper import IRASScraper, ExcelHandler, Config, BrowserPool
 
 def example_1_single_uen():
     """Example 1: Process a single UEN programmatically."""
     print("🔍 Example 1: Single UEN Processing")
     
     # Initialize with custom configuration
-    config = Config()
-    config.HEADLESS = False  # Show browser for demo
+    config = Config(HEADLESS=False)  # Show browser for demo
     scraper = IRASScraper(config)
     
     try:
@@ -40,11 +39,10 @@ def example_1_single_uen():
 
 
 def example_2_batch_processing():
-    """Example 2: Process multiple UENs efficiently with session reuse."""
+    """Example 2: Process multiple UENs in parallel with pooled browsers."""
     print("📊 Example 2: Batch Processing")
     
-    config = Config()
-    config.REQUEST_DELAY = 0.3  # Faster processing
+    config = Config(REQUEST_DELAY=0.3)  # Faster processing
     scraper = IRASScraper(config)
     
     # List of UENs to process
@@ -55,9 +53,9 @@ def example_2_batch_processing():
     ]
     
     try:
-        # Process all UENs with session reuse (efficient!)
+        # Process UENs concurrently, one browser per worker (efficient!)
         print(f"Processing {len(uens)} UENs...")
-        results = scraper.scrape_multiple_uens(uens)
+        results = scraper.scrape_multiple_uens_parallel(uens, concurrency=3)
         
         # Display summary
         successful = sum(1 for r in results if r['success'])
@@ -68,7 +66,7 @@ def example_2_batch_processing():
             print(f"  {status} {result['uen']}")
             
     finally:
-        # Session is automatically closed by scrape_multiple_uens
+        # Browsers are automatically closed by scrape_multiple_uens_parallel
         pass
     
     print("✅ Example 2 completed\n")
@@ -96,8 +94,7 @@ def example_3_excel_integration():
         print(f"Read {len(uens)} UENs from Excel file")
         
         # Process UENs
-        config = Config()
-        config.HEADLESS = True  # Background processing
+        config = Config(HEADLESS=True)  # Background processing
         scraper = IRASScraper(config)
         
         results = scraper.scrape_multiple_uens(uens)
@@ -117,10 +114,9 @@ def example_4_custom_business_logic():
     print("🏢 Example 4: Business Logic Integration")
     
     class CompanyValidator:
-        def __init__(self):
-            config = Config()
-            config.HEADLESS = True
-            self.scraper = IRASScraper(config)
+        def __init__(self, pool):
+            # Sessions borrow a warm browser from the pool instead of launching Chrome
+            self.scraper = IRASScraper(pool.config, pool=pool)
         
         def is_gst_registered(self, uen):
             """Check if a company is GST registered."""
@@ -154,18 +150,21 @@ def example_4_custom_business_logic():
             finally:
                 self.scraper.close_session()
     
-    # Use the custom validator
-    validator = CompanyValidator()
-    
-    test_uen = "200012345A"
-    
-    # Check GST registration
-    is_registered = validator.is_gst_registered(test_uen)
-    print(f"UEN {test_uen} GST registered: {is_registered}")
+    config = Config(HEADLESS=True)
     
-    # Get full company info
-    company_info = validator.get_company_info(test_uen)
-    print(f"Company info: {company_info}")
+    # Use the custom validator (browser pool is shared across checks)
+    with BrowserPool(config, size=1) as pool:
+        validator = CompanyValidator(pool)
+        
+        test_uen = "200012345A"
+        
+        # Check GST registration
+        is_registered = validator.is_gst_registered(test_uen)
+        print(f"UEN {test_uen} GST registered: {is_registered}")
+        
+        # Get full company info
+        company_info = validator.get_company_info(test_uen)
+        print(f"Company info: {company_info}")
     
     print("✅ Example 4 completed\n")
 
@@ -4,9 +4,30 @@ A high-performance Python package for scraping IRAS website data with advanced
 ReCAPTCHA v2 solving capabilities and optimized batch processing.
 """
 
-from .scraper import IRASScraper
-from .excel_handler import ExcelHandler
-from .config import Config
+import importlib
 
 __version__ = "1.0.0"
-__all__ = ["IRASScraper", "ExcelHandler", "Config"]
\ No newline at end of file
+__all__ = ["IRASScraper", "ExcelHandler", "Config", "BrowserPool", "PlaywrightIRASScraper"]
+
+# Public names are imported on first access (PEP 562) so scripts that only
+# need the scraper don't pay for pandas/openpyxl, and vice versa.
+_LAZY = {
+    "IRASScraper": ".scraper",
+    "ExcelHandler": ".excel_handler",
+    "Config": ".config",
+    "BrowserPool": ".pool",
+    "PlaywrightIRASScraper": ".scraper_pw",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,71 @@
+"""Shared logging setup and helpers for the ReCAPTCHA debug scripts."""
+
+import queue
+import signal
+import atexit
+import logging
+import logging.handlers
+import threading
+from pathlib import Path
+from typing import IO, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure(
+    level: int = logging.DEBUG,
+    logfile: Optional[str] = None,
+    async_: bool = True,
+    stream: Optional[IO[str]] = None
+) -> Optional[logging.handlers.QueueListener]:
+    """Configure root logging for console and optional file output.
+
+    Args:
+        level: Root logging level
+        logfile: Path of a log file to write alongside the console
+        async_: Write records on a background QueueListener thread so
+            callers never block on console/disk I/O
+        stream: Console stream (defaults to stderr)
+
+    Returns:
+        The started QueueListener when async_ is True, otherwise None
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    handlers = [logging.StreamHandler(stream)]
+    if logfile:
+        Path(logfile).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(logfile))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = None
+    if async_:
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(listener.stop)
+        handlers = [logging.handlers.QueueHandler(log_queue)]
+
+    logging.basicConfig(level=level, handlers=handlers)
+
+    # Reduce selenium logging noise
+    logging.getLogger('selenium').setLevel(logging.WARNING)
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+
+    return listener
+
+
+def wait_for_inspection(seconds: float) -> bool:
+    """Keep the browser open until the timeout expires or Ctrl+C is pressed.
+
+    Returns:
+        True if the wait was interrupted by Ctrl+C, False on timeout
+    """
+    stop_event = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    try:
+        return stop_event.wait(seconds)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
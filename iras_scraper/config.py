@@ -1,69 +1,113 @@
 """Configuration settings for the IRAS scraper."""
 
 import os
-from typing import Dict, Any
+import shutil
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _bool(value: str) -> bool:
+    """Parse a "true"/"false" environment value."""
+    return value.lower() == "true"
+
+
+def _env(name: str, default: Any, cast: Callable[[str], Any] = str) -> Any:
+    """Read an environment variable once, falling back to default when unset."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return cast(value)
+
+
+@functools.lru_cache(maxsize=4)
+def _ffmpeg_available(ffmpeg_path: Optional[str] = None) -> bool:
+    """Check if ffmpeg is available on the system (cached per process).
+    
+    An explicit ffmpeg_path skips the $PATH scan when it points at a file.
+    """
+    if ffmpeg_path and os.path.isfile(ffmpeg_path):
+        return True
+    return shutil.which("ffmpeg") is not None
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration class for IRAS scraper settings."""
+    """Configuration class for IRAS scraper settings.
+    
+    Defaults are read from the environment once at import. Instances are
+    immutable; derive overrides with ``Config(HEADLESS=True)`` or
+    ``dataclasses.replace(config, HEADLESS=True)``.
+    """
     
     # IRAS Website Settings
-    IRAS_URL = "https://mytax.iras.gov.sg/ESVWeb/default.aspx?target=MGSTListingSearch"
+    IRAS_URL: str = "https://mytax.iras.gov.sg/ESVWeb/default.aspx?target=MGSTListingSearch"
     
     # Browser Settings
-    HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
-    WINDOW_SIZE = os.getenv("WINDOW_SIZE", "1920,1080")
+    HEADLESS: bool = _env("HEADLESS", False, _bool)
+    WINDOW_SIZE: str = _env("WINDOW_SIZE", "1920,1080")
     
     # User Agents (Updated to current versions)
-    USER_AGENTS = [
+    USER_AGENTS: Tuple[str, ...] = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-    ]
+    )
     
     # Selenium Settings (CAPTCHA-Friendly Timeouts)
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "8"))       # Slightly longer for CAPTCHA elements
-    PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "20"))  # More time for CAPTCHA loading
-    ELEMENT_WAIT_TIMEOUT = int(os.getenv("ELEMENT_WAIT_TIMEOUT", "10"))  # CAPTCHA elements need time
+    IMPLICIT_WAIT: int = _env("IMPLICIT_WAIT", 8, int)       # Unused: drivers run with implicit wait 0 and explicit waits
+    PAGE_LOAD_TIMEOUT: int = _env("PAGE_LOAD_TIMEOUT", 20, int)  # More time for CAPTCHA loading
+    ELEMENT_WAIT_TIMEOUT: int = _env("ELEMENT_WAIT_TIMEOUT", 10, int)  # CAPTCHA elements need time
+    RESULTS_TIMEOUT: int = _env("RESULTS_TIMEOUT", 20, int)  # Results table or "no records" message after searching
     
     # ReCAPTCHA Settings (Optimized for Success Rate)
-    RECAPTCHA_AUDIO_SOLVING = True
-    RECAPTCHA_MAX_RETRIES = int(os.getenv("RECAPTCHA_MAX_RETRIES", "3"))  # Increased for better success
-    RECAPTCHA_AUTO_SOLVE = os.getenv("RECAPTCHA_AUTO_SOLVE", "true").lower() == "true"
+    RECAPTCHA_AUDIO_SOLVING: bool = True
+    RECAPTCHA_MAX_RETRIES: int = _env("RECAPTCHA_MAX_RETRIES", 3, int)  # Increased for better success
+    RECAPTCHA_AUTO_SOLVE: bool = _env("RECAPTCHA_AUTO_SOLVE", True, _bool)
     
     # Auto-detect ffmpeg availability for audio CAPTCHA solving
-    @staticmethod
-    def is_ffmpeg_available():
-        """Check if ffmpeg is available on the system."""
-        import shutil
-        return shutil.which("ffmpeg") is not None
+    FFMPEG_PATH: Optional[str] = _env("FFMPEG_PATH", None)  # Explicit ffmpeg binary, skips $PATH lookup
     
     # Rate Limiting (Optimized)
-    REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "0.5"))   # Reduced from 2.0
-    RANDOM_DELAY_RANGE = (0.2, 0.8)  # Much faster delays
-    NAVIGATION_DELAY = float(os.getenv("NAVIGATION_DELAY", "1.0"))  # Page navigation delays
+    REQUEST_DELAY: float = _env("REQUEST_DELAY", 0.5, float)   # Reduced from 2.0
+    RANDOM_DELAY_RANGE: Tuple[float, float] = (0.2, 0.8)  # Much faster delays
+    NAVIGATION_DELAY: float = _env("NAVIGATION_DELAY", 1.0, float)  # Page navigation delays
+    JITTER_SCALE: float = _env("JITTER_SCALE", 1.0, float)  # Multiplier for human-like random pauses (0 disables them)
+    HUMAN_LIKE_CLICK: bool = _env("HUMAN_LIKE_CLICK", False, _bool)  # Move a real pointer for clicks instead of a JavaScript click
+    SIMULATE_BROWSING: bool = _env("SIMULATE_BROWSING", False, _bool)  # Random homepage visits and cookie resets (slow)
     
     # WebDriver Settings
-    CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", None)  # Manual ChromeDriver path for network-restricted environments
-    WDM_LOCAL = os.getenv("WDM_LOCAL", "false").lower() == "true"  # Use only local drivers
+    CHROMEDRIVER_PATH: Optional[str] = _env("CHROMEDRIVER_PATH", None)  # Manual ChromeDriver path for network-restricted environments
+    WDM_LOCAL: bool = _env("WDM_LOCAL", False, _bool)  # Use only local drivers
+    WEBDRIVER_POOL_MAXSIZE: int = _env("WEBDRIVER_POOL_MAXSIZE", 20, int)  # urllib3 connections kept open to chromedriver
+    
+    # Browser Pool Settings
+    POOL_SIZE: int = _env("POOL_SIZE", 4, int)  # Max Chrome instances kept by BrowserPool
+    MAX_USES_PER_INSTANCE: int = _env("MAX_USES_PER_INSTANCE", 50, int)  # Sessions before a pooled driver is recycled
+    PARALLEL_WORKERS: int = _env("PARALLEL_WORKERS", 1, int)  # Chrome instances scraping a batch at once (1 = sequential)
     
     # File Paths
-    INPUT_EXCEL_PATH = os.getenv("INPUT_EXCEL_PATH", "data/input_uens.xlsx")
-    OUTPUT_EXCEL_PATH = os.getenv("OUTPUT_EXCEL_PATH", "data/output_results.xlsx")
+    INPUT_EXCEL_PATH: str = _env("INPUT_EXCEL_PATH", "data/input_uens.xlsx")
+    OUTPUT_EXCEL_PATH: str = _env("OUTPUT_EXCEL_PATH", "data/output_results.xlsx")
     
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE = os.getenv("LOG_FILE", "logs/scraper.log")
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
+    LOG_FILE: str = _env("LOG_FILE", "logs/scraper.log")
+    DEBUG_SCREENSHOTS: bool = _env("DEBUG_SCREENSHOTS", False, _bool)  # Save ReCAPTCHA screenshots to logs/screenshots
     
     # Chrome Driver Settings (Ultra-Lightweight & CAPTCHA-Friendly)
-    CHROME_OPTIONS = [
+    CHROME_OPTIONS: Tuple[str, ...] = (
         "--no-sandbox",  # Required for Docker/Linux environments
         "--disable-dev-shm-usage",  # Prevents crashes in limited memory
         "--disable-blink-features=AutomationControlled",  # Essential webdriver hiding
         "--no-first-run",  # Skip first-run setup
         "--disable-default-apps"  # Minimal system interaction
-    ]
+    )
+    
+    def is_ffmpeg_available(self) -> bool:
+        """Check if ffmpeg is available, preferring FFMPEG_PATH when set."""
+        return _ffmpeg_available(self.FFMPEG_PATH)
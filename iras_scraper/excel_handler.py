@@ -1,10 +1,141 @@
 """Excel file handler for reading UENs and writing results."""
 
+import pickle
+import tempfile
+import importlib.util
 import pandas as pd
-from typing import List, Dict, Any
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+from typing import List, Dict, Any, Iterable, Tuple
 import logging
 from pathlib import Path
 
+# Optional Rust-based XLSX reader (much faster than openpyxl for large sheets);
+# install with: uv sync --extra calamine
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SHEET = 'IRAS_Search_Results'
+
+# Supported output suffixes: a styled Excel workbook, or plain columnar
+# Parquet, which needs the optional pyarrow package (uv sync --extra parquet)
+OUTPUT_FORMATS = ('xlsx', 'parquet')
+
+# Parquet output is only possible with pyarrow installed
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# User-friendly output column names
+COLUMN_LABELS = {
+    'uen': 'UEN',
+    'success': 'Success',
+    'gst_registration_status': 'GST Registration Status', 
+    'business_status': 'Business Status',
+    'company_name': 'Company Name',
+    'entity_type': 'Entity Type',
+    'registration_date': 'Registration Date',
+    'extraction_status': 'Data Extraction Status',
+    'raw_search_results': 'Raw Search Results',
+    'page_title': 'Page Title',
+    'page_url': 'Page URL',
+    'extraction_error': 'Extraction Error',
+    'error': 'Error Message',
+    'timestamp': 'Timestamp'
+}
+
+# Scraper data keys and the output columns they expand into
+DATA_FIELD_COLUMNS = {
+    'gst_registration': 'gst_registration_status',
+    'status': 'business_status',
+    'company_name': 'company_name',
+    'entity_type': 'entity_type',
+    'registration_date': 'registration_date',
+    'extraction_status': 'extraction_status',
+    'raw_results': 'raw_search_results',
+    'page_title': 'page_title',
+    'page_url': 'page_url',
+    'extraction_error': 'extraction_error',
+}
+
+# Consistent output column order
+COLUMN_ORDER = [
+    'uen', 'success', 'gst_registration_status', 'business_status', 
+    'company_name', 'entity_type', 'registration_date', 'extraction_status',
+    'raw_search_results', 'page_title', 'page_url', 'extraction_error', 
+    'error', 'timestamp'
+]
+
+# Low-cardinality result columns kept as pandas categoricals
+CATEGORY_COLUMNS = [
+    'success', 'gst_registration_status', 'business_status',
+    'entity_type', 'extraction_status'
+]
+
+# Fixed widths for the standard output columns
+COLUMN_WIDTHS = {
+    'UEN': 15,
+    'Success': 10, 
+    'GST Registration Status': 25,
+    'Business Status': 20,
+    'Company Name': 40,
+    'Entity Type': 20,
+    'Registration Date': 18,
+    'Data Extraction Status': 20,
+    'Raw Search Results': 80,
+    'Error Message': 30,
+    'Timestamp': 20
+}
+
+# Results header style, shared by every header cell
+_HEADER_FONT = Font(bold=True, color='FFFFFF')
+_HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+_HEADER_ALIGN = Alignment(horizontal='center')
+
+
+def _cell_value(value: Any) -> Any:
+    """Convert a DataFrame value for openpyxl, writing NaN/None as a blank cell."""
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value
+
+
+def _expanded_row(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one scraping result into output columns.
+    
+    Shared by write_results (through _expand_data_columns) and
+    write_results_stream, so both writers produce the same columns.
+    """
+    row = {
+        'uen': result.get('uen', ''),
+        'success': result.get('success', False),
+        'error': result.get('error'),
+        'timestamp': result.get('timestamp', '')
+    }
+    
+    data = result.get('data', {})
+    if isinstance(data, dict):
+        for key, column in DATA_FIELD_COLUMNS.items():
+            row[column] = data.get(key, '')
+        for key, value in data.items():
+            if key not in DATA_FIELD_COLUMNS:
+                row[f'data_{key}'] = value
+    else:
+        row['data_raw'] = str(data) if data else ''
+    
+    return row
+
+
+def _output_columns(columns: Iterable[str]) -> List[str]:
+    """Order output columns: COLUMN_ORDER first, then the rest as first seen."""
+    columns = list(columns)
+    return [col for col in COLUMN_ORDER if col in columns] + [col for col in columns if col not in COLUMN_ORDER]
+
 
 class ExcelHandler:
     """Handles Excel file operations for UEN input and result output."""
@@ -18,7 +149,47 @@ class ExcelHandler:
         """
         self.input_file = Path(input_file)
         self.output_file = Path(output_file)
-        self.logger = logging.getLogger(__name__)
+        self._input_cache = None
+    
+    def _load_input(self) -> Tuple[tuple, List[tuple]]:
+        """Parse the input sheet once and return its header and data rows.
+        
+        The parsed rows are shared by validate_input_file and read_uens and
+        re-read only when the input file's modification time changes.
+        
+        Returns:
+            Tuple of (header row, list of data rows)
+        """
+        mtime = self.input_file.stat().st_mtime
+        if self._input_cache and self._input_cache[0] == mtime:
+            return self._input_cache[1]
+        
+        if CALAMINE_AVAILABLE:
+            sheet = CalamineWorkbook.from_path(str(self.input_file)).get_sheet_by_index(0)
+            rows = [
+                tuple(self._normalize_cell(value) for value in row)
+                for row in sheet.to_python(skip_empty_area=False)
+            ]
+        else:
+            # Stream cell values from a read-only workbook
+            workbook = load_workbook(self.input_file, read_only=True, data_only=True)
+            try:
+                rows = list(workbook.worksheets[0].iter_rows(values_only=True))
+            finally:
+                workbook.close()
+        
+        table = (rows[0] if rows else (), rows[1:])
+        self._input_cache = (mtime, table)
+        return table
+    
+    @staticmethod
+    def _normalize_cell(value: Any) -> Any:
+        """Match openpyxl cell values: blanks as None, whole floats as int."""
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
     
     def read_uens(self, column_name: str = "UEN") -> List[str]:
         """Read UENs from Excel file.
@@ -34,24 +205,30 @@ class ExcelHandler:
             KeyError: If UEN column doesn't exist
         """
         try:
-            if not self.input_file.exists():
-                raise FileNotFoundError(f"Input file not found: {self.input_file}")
-            
-            df = pd.read_excel(self.input_file)
+            header, rows = self._load_input()
             
-            if column_name not in df.columns:
-                available_columns = ", ".join(df.columns.tolist())
+            if column_name not in header:
+                available_columns = ", ".join(str(c) for c in header if c is not None)
                 raise KeyError(f"Column '{column_name}' not found. Available columns: {available_columns}")
             
-            uens = df[column_name].dropna().astype(str).tolist()
-            self.logger.info(f"Successfully read {len(uens)} UENs from {self.input_file}")
+            column_index = header.index(column_name)
+            uens = [
+                str(row[column_index]) for row in rows
+                if column_index < len(row) and row[column_index] is not None
+            ]
+            logger.info("Successfully read %d UENs from %s", len(uens), self.input_file)
             
             return uens
             
         except Exception as e:
-            self.logger.error(f"Error reading UENs from Excel: {str(e)}")
+            logger.error("Error reading UENs from %s: %s", self.input_file, e)
             raise
     
+    @property
+    def _is_parquet(self) -> bool:
+        """Whether results are written as Parquet rather than Excel."""
+        return self.output_file.suffix.lower() == '.parquet'
+    
     def write_results(self, results: List[Dict[str, Any]], overwrite: bool = True):
         """Write scraping results to Excel file with expanded data columns.
         
@@ -66,79 +243,128 @@ class ExcelHandler:
             # Convert results to DataFrame and expand data columns
             df = self._expand_data_columns(results)
             
-            # Rename columns to be more user-friendly
-            df_formatted = df.copy()
-            column_mapping = {
-                'uen': 'UEN',
-                'success': 'Success',
-                'gst_registration_status': 'GST Registration Status', 
-                'business_status': 'Business Status',
-                'company_name': 'Company Name',
-                'entity_type': 'Entity Type',
-                'registration_date': 'Registration Date',
-                'extraction_status': 'Data Extraction Status',
-                'raw_search_results': 'Raw Search Results',
-                'page_title': 'Page Title',
-                'page_url': 'Page URL',
-                'extraction_error': 'Extraction Error',
-                'error': 'Error Message',
-                'timestamp': 'Timestamp'
-            }
-            
-            # Apply column renaming for existing columns
-            df_formatted = df_formatted.rename(columns={k: v for k, v in column_mapping.items() if k in df_formatted.columns})
-            
-            # Write to Excel with enhanced formatting
-            with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-                df_formatted.to_excel(writer, sheet_name='IRAS_Search_Results', index=False)
-                
-                # Get the workbook and worksheet for formatting
-                workbook = writer.book
-                worksheet = writer.sheets['IRAS_Search_Results']
-                
-                # Format header row
-                from openpyxl.styles import Font, PatternFill, Alignment
-                header_font = Font(bold=True, color='FFFFFF')
-                header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                
-                for col_num, column_title in enumerate(df_formatted.columns, 1):
-                    cell = worksheet.cell(row=1, column=col_num)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal='center')
-                
-                # Auto-adjust column widths
-                for column in df_formatted:
-                    column_width = max(df_formatted[column].astype(str).map(len).max(), len(column)) + 4
-                    col_letter = worksheet.cell(row=1, column=df_formatted.columns.get_loc(column) + 1).column_letter
-                    worksheet.column_dimensions[col_letter].width = min(column_width, 60)
+            # Rename columns to be more user-friendly (in place; df is ours)
+            df.rename(columns=COLUMN_LABELS, inplace=True)
+            
+            # Parquet keeps dtypes and skips the openpyxl styling work entirely
+            if self._is_parquet:
+                df.to_parquet(self.output_file, compression='zstd', index=False)
+                logger.info("Successfully wrote %d results to %s", len(results), self.output_file)
+                return
+            
+            # Measure column widths with vectorized string lengths
+            columns = list(df.columns)
+            value_widths = (
+                df.astype(str).apply(lambda column: column.str.len())
+                .where(df.notna(), 0)
+                .max()
+                .reindex(columns)
+                .fillna(0)
+            )
+            column_widths = [max(int(width), len(column)) for column, width in zip(columns, value_widths)]
+            
+            workbook, worksheet = self._new_results_workbook(columns, column_widths)
+            
+            for row in df.itertuples(index=False, name=None):
+                worksheet.append([_cell_value(value) for value in row])
+            
+            workbook.save(self.output_file)
+            
+            logger.info("Successfully wrote %d results to %s", len(results), self.output_file)
+            
+        except Exception as e:
+            logger.error("Error writing results to Excel: %s", e)
+            raise
+    
+    def write_results_stream(self, results: Iterable[Dict[str, Any]]) -> int:
+        """Write scraping results to Excel as they arrive.
+        
+        Each result is flattened and spooled to a temporary file as soon as
+        it arrives, so the results never need to be held in memory together.
+        The sheet is written from the spool once the iterable is exhausted,
+        because a write-only sheet needs its header and column widths before
+        the first row; columns match write_results, including the data_*
+        extras. Parquet output is written in one go.
+        
+        Args:
+            results: Iterable of result dictionaries, e.g. a generator or queue
+            
+        Returns:
+            Number of results written
+        """
+        if self._is_parquet:
+            results = list(results)
+            self.write_results(results)
+            return len(results)
+        
+        try:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Widest value per column, in the order columns were first seen
+            value_widths: Dict[str, int] = {}
+            count = 0
+            with tempfile.TemporaryFile() as spool:
+                for result in results:
+                    row = _expanded_row(result)
+                    for column, value in row.items():
+                        width = len(str(value)) if value is not None else 0
+                        value_widths[column] = max(value_widths.get(column, 0), width)
+                    pickle.dump(row, spool)
+                    count += 1
                 
-                # Set specific widths for certain columns
-                specific_widths = {
-                    'UEN': 15,
-                    'Success': 10, 
-                    'GST Registration Status': 25,
-                    'Business Status': 20,
-                    'Company Name': 40,
-                    'Entity Type': 20,
-                    'Registration Date': 18,
-                    'Data Extraction Status': 20,
-                    'Raw Search Results': 80,
-                    'Error Message': 30,
-                    'Timestamp': 20
-                }
+                columns = _output_columns(value_widths)
+                labels = [COLUMN_LABELS.get(column, column) for column in columns]
+                workbook, worksheet = self._new_results_workbook(
+                    labels,
+                    [max(value_widths[column], len(label)) for column, label in zip(columns, labels)]
+                )
                 
-                for col_name, width in specific_widths.items():
-                    if col_name in df_formatted.columns:
-                        col_letter = worksheet.cell(row=1, column=df_formatted.columns.get_loc(col_name) + 1).column_letter
-                        worksheet.column_dimensions[col_letter].width = width
+                spool.seek(0)
+                for _ in range(count):
+                    row = pickle.load(spool)
+                    worksheet.append([_cell_value(row.get(column)) for column in columns])
+            
+            workbook.save(self.output_file)
             
-            self.logger.info(f"Successfully wrote {len(results)} results to {self.output_file}")
+            logger.info("Successfully wrote %d results to %s", count, self.output_file)
+            return count
             
         except Exception as e:
-            self.logger.error(f"Error writing results to Excel: {str(e)}")
+            logger.error("Error writing results to Excel: %s", e)
             raise
     
+    def _new_results_workbook(self, columns: List[str], column_widths: List[int]) -> Tuple[Workbook, Any]:
+        """Create a write-only results workbook with sized columns and a styled header.
+        
+        Args:
+            columns: Output column titles
+            column_widths: Widest value (in characters) per column
+            
+        Returns:
+            Tuple of (workbook, worksheet) ready for data rows
+        """
+        # Write-only workbook serializes rows as they are appended
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(RESULTS_SHEET)
+        
+        # Column widths must be set before any row is written; known columns
+        # get fixed widths, the rest fit their content
+        col_letters = [get_column_letter(index) for index in range(1, len(columns) + 1)]
+        for col_letter, column, width in zip(col_letters, columns, column_widths):
+            worksheet.column_dimensions[col_letter].width = COLUMN_WIDTHS.get(column, min(width + 4, 60))
+        
+        # Format header row
+        header_cells = []
+        for column_title in columns:
+            cell = WriteOnlyCell(worksheet, value=column_title)
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            cell.alignment = _HEADER_ALIGN
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        return workbook, worksheet
+    
     def _expand_data_columns(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
         """Expand the nested 'data' column into separate columns for better readability.
         
@@ -148,62 +374,16 @@ class ExcelHandler:
         Returns:
             DataFrame with expanded columns
         """
-        expanded_results = []
-        
-        for result in results:
-            # Start with the base result
-            expanded_result = {
-                'uen': result.get('uen', ''),
-                'success': result.get('success', False),
-                'error': result.get('error', None),
-                'timestamp': result.get('timestamp', '')
-            }
-            
-            # Extract and expand the data dictionary if it exists
-            data_dict = result.get('data', {})
-            if isinstance(data_dict, dict):
-                # Add key data fields as separate columns with user-friendly names
-                expanded_result.update({
-                    'gst_registration_status': data_dict.get('gst_registration', ''),
-                    'business_status': data_dict.get('status', ''),
-                    'company_name': data_dict.get('company_name', ''),
-                    'entity_type': data_dict.get('entity_type', ''),
-                    'registration_date': data_dict.get('registration_date', ''),
-                    'extraction_status': data_dict.get('extraction_status', ''),
-                    'raw_search_results': data_dict.get('raw_results', ''),
-                    'page_title': data_dict.get('page_title', ''),
-                    'page_url': data_dict.get('page_url', ''),
-                    'extraction_error': data_dict.get('extraction_error', ''),
-                })
-                
-                # Add any additional fields that might be present
-                for key, value in data_dict.items():
-                    if key not in ['gst_registration', 'status', 'company_name', 'entity_type', 
-                                 'registration_date', 'extraction_status', 'raw_results', 
-                                 'page_title', 'page_url', 'extraction_error']:
-                        expanded_result[f'data_{key}'] = value
-            else:
-                # If data is not a dict, store it as-is
-                expanded_result['data_raw'] = str(data_dict) if data_dict else ''
-            
-            expanded_results.append(expanded_result)
-        
-        # Create DataFrame with consistent column order
-        column_order = [
-            'uen', 'success', 'gst_registration_status', 'business_status', 
-            'company_name', 'entity_type', 'registration_date', 'extraction_status',
-            'raw_search_results', 'page_title', 'page_url', 'extraction_error', 
-            'error', 'timestamp'
-        ]
+        if not results:
+            return pd.DataFrame()
         
-        df = pd.DataFrame(expanded_results)
+        # Flatten each result with the same rules the streaming writer uses
+        df = pd.DataFrame([_expanded_row(result) for result in results])
         
-        # Reorder columns (only include existing ones)
-        existing_columns = [col for col in column_order if col in df.columns]
-        remaining_columns = [col for col in df.columns if col not in existing_columns]
-        final_column_order = existing_columns + remaining_columns
-        
-        return df[final_column_order]
+        # Repetitive status columns are stored once per distinct value
+        return df[_output_columns(df.columns)].astype(
+            {col: 'category' for col in CATEGORY_COLUMNS if col in df.columns}
+        )
     
     def append_results(self, new_results: List[Dict[str, Any]]):
         """Append new results to existing Excel file.
@@ -212,21 +392,57 @@ class ExcelHandler:
             new_results: List of new results to append
         """
         try:
-            existing_results = []
+            df = self._expand_data_columns(new_results)
+            df.rename(columns=COLUMN_LABELS, inplace=True)
+            
+            # A missing output file is created from scratch
+            try:
+                if self._is_parquet:
+                    existing = pd.read_parquet(self.output_file)
+                else:
+                    workbook = load_workbook(self.output_file)
+            except FileNotFoundError:
+                self.write_results(new_results)
+                return
             
-            # Read existing results if file exists
-            if self.output_file.exists():
-                existing_df = pd.read_excel(self.output_file)
-                existing_results = existing_df.to_dict('records')
+            if self._is_parquet:
+                combined = pd.concat([existing, df], ignore_index=True)
+                combined.to_parquet(self.output_file, compression='zstd', index=False)
+                logger.info("Successfully appended %d results to %s", len(new_results), self.output_file)
+                return
             
-            # Combine existing and new results
-            all_results = existing_results + new_results
+            # Append rows to the existing sheet instead of rewriting the whole file
+            try:
+                # Files saved by older versions or by hand may name the sheet
+                # differently; results then go to the first sheet
+                if RESULTS_SHEET in workbook.sheetnames:
+                    worksheet = workbook[RESULTS_SHEET]
+                else:
+                    worksheet = workbook.worksheets[0]
+                    logger.warning("No '%s' sheet in %s, appending to '%s'",
+                                   RESULTS_SHEET, self.output_file, worksheet.title)
+                header = [cell.value for cell in worksheet[1]]
+                # An empty sheet reads back as a single blank header cell
+                while header and header[-1] is None:
+                    header.pop()
+                
+                # Columns first seen in this batch go to the end of the header
+                for column in df.columns:
+                    if column not in header:
+                        header.append(column)
+                        worksheet.cell(row=1, column=len(header), value=column)
+                
+                for row in df.reindex(columns=header).itertuples(index=False):
+                    worksheet.append([_cell_value(value) for value in row])
+                
+                workbook.save(self.output_file)
+            finally:
+                workbook.close()
             
-            # Write combined results
-            self.write_results(all_results)
+            logger.info("Successfully appended %d results to %s", len(new_results), self.output_file)
             
         except Exception as e:
-            self.logger.error(f"Error appending results: {str(e)}")
+            logger.error("Error appending results to %s: %s", self.output_file, e)
             raise
     
     def validate_input_file(self, required_columns: List[str] = None) -> bool:
@@ -242,26 +458,28 @@ class ExcelHandler:
             required_columns = ["UEN"]
         
         try:
-            if not self.input_file.exists():
-                self.logger.error(f"Input file does not exist: {self.input_file}")
-                return False
-            
-            df = pd.read_excel(self.input_file)
+            # Parsed once and cached, so a following read_uens() reuses it
+            header, rows = self._load_input()
+            has_data = any(any(value is not None for value in row) for row in rows)
             
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in required_columns if col not in header]
             if missing_columns:
-                self.logger.error(f"Missing required columns: {missing_columns}")
+                logger.error("Missing required columns: %s", missing_columns)
                 return False
             
-            if df.empty:
-                self.logger.error("Input file is empty")
+            if not has_data:
+                logger.error("Input file is empty")
                 return False
             
-            self.logger.info("Input file validation successful")
+            logger.info("Input file validation successful")
             return True
             
+        except FileNotFoundError:
+            logger.error("Input file does not exist: %s", self.input_file)
+            return False
+            
         except Exception as e:
-            self.logger.error(f"Error validating input file: {str(e)}")
+            logger.error("Error validating input file %s: %s", self.input_file, e)
             return False
     
     def create_sample_input(self, sample_uens: List[str] = None):
@@ -287,8 +505,8 @@ class ExcelHandler:
             # Write sample file
             df.to_excel(self.input_file, index=False)
             
-            self.logger.info(f"Created sample input file: {self.input_file}")
+            logger.info("Created sample input file: %s", self.input_file)
             
         except Exception as e:
-            self.logger.error(f"Error creating sample input file: {str(e)}")
+            logger.error("Error creating sample input file: %s", e)
             raise
\ No newline at end of file
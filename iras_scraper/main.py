@@ -2,10 +2,17 @@
 
 import argparse
 import sys
+import queue
 import logging
+import threading
+import dataclasses
 from pathlib import Path
 
 from iras_scraper import IRASScraper, ExcelHandler, Config
+from iras_scraper.excel_handler import OUTPUT_FORMATS, PARQUET_AVAILABLE
+
+# Scraped results buffered ahead of the Excel writer thread
+RESULT_QUEUE_SIZE = 100
 
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
@@ -47,6 +54,12 @@ def main():
         help='Path to output Excel file for results (default: data/output_results.xlsx)'
     )
     
+    parser.add_argument(
+        '--output-format',
+        choices=OUTPUT_FORMATS,
+        help='Output file format; replaces the --output suffix (default: inferred from --output)'
+    )
+    
     parser.add_argument(
         '--column', '-c',
         type=str,
@@ -87,11 +100,11 @@ def main():
     
     args = parser.parse_args()
     
-    # Set up logging
+    # Set up logging (also creates the logs directory)
     logger = setup_logging(args.log_level)
     
-    # Create logs directory
-    Path('logs').mkdir(exist_ok=True)
+    if args.output_format:
+        args.output = str(Path(args.output).with_suffix(f'.{args.output_format}'))
     
     try:
         # Initialize Excel handler
@@ -113,6 +126,11 @@ def main():
                 logger.error("Input file validation failed")
                 return 1
         
+        # Fail before scraping rather than losing every result at write time
+        if Path(args.output).suffix.lower() == '.parquet' and not PARQUET_AVAILABLE:
+            logger.error("Parquet output requires pyarrow. Install with: uv sync --extra parquet")
+            return 1
+        
         # Validate input file exists
         if not excel_handler.validate_input_file([args.column]):
             logger.error("Input file validation failed. Use --create-sample to create a sample file.")
@@ -136,26 +154,59 @@ def main():
         # Configure scraper
         config = Config()
         if args.headless:
-            config.HEADLESS = True
+            config = dataclasses.replace(config, HEADLESS=True)
             logger.warning("Running in headless mode - ReCAPTCHA solving may be more difficult")
         
         # Initialize and run scraper
         logger.info("Starting IRAS scraping session...")
         scraper = IRASScraper(config)
         
-        # Process all UENs
-        results = scraper.scrape_multiple_uens(uens)
-        
-        # Write results to Excel
+        # Write results on a background thread while scraping continues
         logger.info(f"Writing results to: {args.output}")
-        excel_handler.write_results(results)
+        result_queue = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+        writer_errors = []
+        
+        def write_queued_results():
+            try:
+                excel_handler.write_results_stream(iter(result_queue.get, None))
+            except Exception as e:
+                writer_errors.append(e)
+                # Keep draining so the scraper never blocks on a full queue
+                for _ in iter(result_queue.get, None):
+                    pass
+        
+        writer = threading.Thread(target=write_queued_results, name='results-writer')
+        writer.start()
+        
+        # Process all UENs (results arrive in input order)
+        total_results = 0
+        successful_results = 0
+        results = scraper.iter_scrape_uens(uens)
+        try:
+            for result in results:
+                result_queue.put(result)
+                total_results += 1
+                successful_results += bool(result['success'])
+                
+                # Results can no longer be saved; stop scraping the rest
+                if writer_errors:
+                    logger.error("Results writer failed, stopping the scrape")
+                    break
+        finally:
+            # Close the scraping session, then flush whatever was scraped,
+            # including on Ctrl+C
+            results.close()
+            result_queue.put(None)
+            writer.join()
+        
+        if writer_errors:
+            raise writer_errors[0]
         
         # Summary
-        successful_results = sum(1 for r in results if r['success'])
-        failed_results = len(results) - successful_results
+        failed_results = total_results - successful_results
         
-        logger.info(f"Scraping completed!")
-        logger.info(f"  Total UENs processed: {len(results)}")
+        logger.info("Scraping completed!")
+        logger.info(f"  Total UENs processed: {total_results}")
         logger.info(f"  Successful: {successful_results}")
         logger.info(f"  Failed: {failed_results}")
         logger.info(f"  Results saved to: {args.output}")
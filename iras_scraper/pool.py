@@ -0,0 +1,161 @@
+"""Browser pool for reusing Chrome WebDriver instances across sessions."""
+
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Dict
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from .config import Config
+
+
+class BrowserPool:
+    """Pool of stealth-configured Chrome drivers shared between scraper sessions.
+
+    Drivers are created on demand up to ``size`` and handed out with
+    ``acquire()``. ``release()`` resets a driver (cookies cleared, blank
+    page) and returns it to the pool, or quits it once it has served
+    ``max_uses`` sessions or was flagged as broken. Idle drivers whose
+    browser session has died are replaced on the next ``acquire()``.
+    """
+
+    def __init__(self, config: Config = None, size: int = None, max_uses: int = None):
+        """Initialize the browser pool.
+
+        Args:
+            config: Configuration used to build new drivers (uses default if None)
+            size: Maximum number of live drivers (defaults to Config.POOL_SIZE)
+            max_uses: Sessions served before a driver is recycled
+                (defaults to Config.MAX_USES_PER_INSTANCE)
+        """
+        self.config = config or Config()
+        self.size = size or self.config.POOL_SIZE
+        self.max_uses = max_uses or self.config.MAX_USES_PER_INSTANCE
+        self.logger = logging.getLogger(__name__)
+
+        # Guards _idle and _created; notified whenever a driver or a slot frees up
+        self._idle = deque()
+        self._available = threading.Condition()
+        self._created = 0
+        self._uses: Dict[int, int] = {}
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Build a new driver with the same settings IRASScraper uses."""
+        from .scraper import IRASScraper
+
+        driver = IRASScraper(self.config)._setup_driver()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def acquire(self, timeout: float = None) -> webdriver.Chrome:
+        """Check out a driver, creating one if the pool is not yet full.
+
+        Args:
+            timeout: Seconds to wait for a free driver (waits forever if None)
+
+        Returns:
+            A ready-to-use Chrome WebDriver
+
+        Raises:
+            queue.Empty: If no driver became available within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._available:
+                while not self._idle and self._created >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self._available.wait(remaining)
+
+                if self._idle:
+                    driver = self._idle.popleft()
+                else:
+                    driver = None
+                    self._created += 1
+
+            if driver is None:
+                try:
+                    return self._create_driver()
+                except Exception:
+                    self._free_slot()
+                    raise
+
+            if self._is_alive(driver):
+                return driver
+            self.logger.info("Replacing pooled driver with a lost browser session")
+            self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """Check that the driver's browser session still answers commands."""
+        if not driver.session_id:
+            return False
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def release(self, driver: webdriver.Chrome, discard: bool = False):
+        """Return a driver to the pool.
+
+        Args:
+            driver: Driver previously obtained from acquire()
+            discard: Quit the driver instead of reusing it (e.g. after an error)
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if discard or uses >= self.max_uses:
+            self.logger.debug(f"Recycling pooled driver after {uses} uses")
+            self._quit(driver)
+            return
+
+        # Reset browser state instead of relaunching Chrome for the next session
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException as e:
+            self.logger.info(f"Discarding pooled driver that failed to reset: {str(e)}")
+            self._quit(driver)
+            return
+
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    def _quit(self, driver: webdriver.Chrome):
+        """Quit a driver and free its slot in the pool."""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error closing pooled WebDriver: {str(e)}")
+        finally:
+            self._uses.pop(id(driver), None)
+            self._free_slot()
+
+    def _free_slot(self):
+        """Give up a driver slot and wake one waiter so it can create a driver."""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+    def close(self):
+        """Quit all idle drivers held by the pool."""
+        with self._available:
+            idle = list(self._idle)
+            self._idle.clear()
+        for driver in idle:
+            self._quit(driver)
+        self.logger.info("Browser pool closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
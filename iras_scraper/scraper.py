@@ -1,42 +1,387 @@
 """Main IRAS web scraper with ReCAPTCHA v2 solving capabilities."""
 
+import re
 import time
 import random
 import logging
-from typing import Dict, Any, List
+import functools
+import threading
+import importlib.util
+import multiprocessing.util
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+import urllib3
+import selenium
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 
-# Optional import for ReCAPTCHA solver
-try:
-    from selenium_recaptcha_solver import RecaptchaSolver
-    RECAPTCHA_SOLVER_AVAILABLE = True
-except ImportError:
-    RECAPTCHA_SOLVER_AVAILABLE = False
-    print("Warning: selenium-recaptcha-solver not available. Install with: uv sync --extra recaptcha")
+# Optional ReCAPTCHA solver: only looked up here, imported by start_session()
+RECAPTCHA_SOLVER_AVAILABLE = importlib.util.find_spec("selenium_recaptcha_solver") is not None
 
 from .config import Config
+from .pool import BrowserPool
+
+# WebDriver connection pool tuning relies on Selenium 4 internals
+_SELENIUM_MAJOR = int(selenium.__version__.split(".")[0])
+
+# Debug screenshots location (written only when DEBUG_SCREENSHOTS is enabled)
+SCREENSHOT_DIR = Path("logs/screenshots")
+
+# Seconds to wait for a ReCAPTCHA iframe before treating the page as CAPTCHA-free
+RECAPTCHA_PRESENCE_TIMEOUT = 5
+
+# Shared ReCAPTCHA selectors
+RECAPTCHA_IFRAME_SELECTOR = "iframe[src*='recaptcha']"
+RECAPTCHA_CONTAINER_SELECTOR = ".g-recaptcha"
+RECAPTCHA_ANCHOR_SELECTOR = "iframe[src*='recaptcha/api2/anchor']"  # Checkbox iframe
+RECAPTCHA_CHALLENGE_SELECTOR = "iframe[src*='recaptcha/api2/bframe']"  # Image/audio challenge iframe
+
+# Lengths of the g-recaptcha-response tokens (non-zero once solved)
+_RECAPTCHA_TOKEN_LENGTHS_JS = "[...document.getElementsByName('g-recaptcha-response')].map(e => (e.value || '').length)"
+
+# In-page probe returning iframe srcs, container count and response token lengths
+_RECAPTCHA_PROBE_JS = """() => ({
+    frames: [...document.querySelectorAll("%s")].map(f => f.src),
+    containers: document.querySelectorAll("%s").length,
+    tokens: %s
+})""" % (RECAPTCHA_IFRAME_SELECTOR, RECAPTCHA_CONTAINER_SELECTOR, _RECAPTCHA_TOKEN_LENGTHS_JS)
+
+# Lightweight CAPTCHA-friendly anti-detection JavaScript
+_STEALTH_JS = """
+// Remove primary webdriver detection
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+
+// Clean Chrome automation variables (most critical ones only)
+['cdc_adoQpoasnfa76pfcZLmcfl_Array', 'cdc_adoQpoasnfa76pfcZLmcfl_Promise', 
+ 'cdc_adoQpoasnfa76pfcZLmcfl_Symbol'].forEach(prop => delete window[prop]);
+
+// Fix chrome.runtime detection (key for Google services)
+if (window.chrome) {
+    window.chrome.runtime = window.chrome.runtime || {};
+    Object.defineProperty(window.chrome.runtime, 'onConnect', {value: undefined});
+}
+"""
+
+# Realistic viewport and mouse tracking (headed browsers only). Timers are
+# left alone: wrapping setTimeout slowed every timer on the page.
+_VIEWPORT_JS = """
+if (!window.__iras_viewport_init) {
+    window.__iras_viewport_init = true;
+
+    // Set realistic viewport
+    const viewport = {
+        width: window.screen.width,
+        height: window.screen.height,
+        deviceScaleFactor: window.devicePixelRatio || 1
+    };
+
+    // Mock realistic mouse movements
+    let mouseX = Math.floor(Math.random() * window.innerWidth);
+    let mouseY = Math.floor(Math.random() * window.innerHeight);
+
+    document.addEventListener('mousemove', (e) => {
+        mouseX = e.clientX;
+        mouseY = e.clientY;
+    });
+}
+"""
+
+_FIND_RECAPTCHA_JS = f"window.__findRecaptcha = {_RECAPTCHA_PROBE_JS};\n"
+
+# Everything injected into each new document, sent as a single CDP script.
+# The IIFE keeps its const/let names out of the page's global scope.
+_PAGE_SCRIPTS_JS = "(() => {%s})();" % "\n".join([_STEALTH_JS, _VIEWPORT_JS, _FIND_RECAPTCHA_JS])
+
+# Headless pages skip the cosmetic viewport script
+_HEADLESS_PAGE_SCRIPTS_JS = "(() => {%s})();" % "\n".join([_STEALTH_JS, _FIND_RECAPTCHA_JS])
+
+# Collects ReCAPTCHA element handles in one round-trip (Selenium returns WebElements)
+_RECAPTCHA_ELEMENTS_JS = """return {
+    frames: [...document.querySelectorAll("%s")],
+    anchors: [...document.querySelectorAll("%s")],
+    challenges: [...document.querySelectorAll("%s")],
+    containers: [...document.querySelectorAll("%s")]
+};""" % (
+    RECAPTCHA_IFRAME_SELECTOR, RECAPTCHA_ANCHOR_SELECTOR,
+    RECAPTCHA_CHALLENGE_SELECTOR, RECAPTCHA_CONTAINER_SELECTOR
+)
+
+# Page summary logged by _debug_page_elements
+_DEBUG_PAGE_JS = """({
+    page_title: document.title,
+    page_url: location.href,
+    has_txtKeyword: !!document.getElementById('txtKeyword'),
+    has_btnSearch: !!document.getElementById('btnSearch'),
+    has_recaptcha_frames: document.querySelectorAll("%s").length,
+    has_recaptcha_containers: document.querySelectorAll("%s").length
+})""" % (RECAPTCHA_IFRAME_SELECTOR, RECAPTCHA_CONTAINER_SELECTOR)
+
+# First element matching arguments[0] that is rendered and not disabled
+_FIRST_USABLE_ELEMENT_JS = """return [...document.querySelectorAll(arguments[0])]
+    .find(e => e.offsetParent !== null && !e.disabled) || null;"""
+
+# Runs [dy, pause_ms] scrollBy steps on animation frames, then calls back
+_SCROLL_SEQUENCE_JS = """
+const steps = arguments[0], done = arguments[arguments.length - 1];
+let i = 0;
+const step = () => {
+    if (i >= steps.length) return done();
+    const [dy, pause] = steps[i++];
+    window.scrollBy(0, dy);
+    setTimeout(() => requestAnimationFrame(step), pause);
+};
+requestAnimationFrame(step);
+"""
+
+# "No records" message in the visible page text (no page_source serialization)
+_NO_RECORDS_TEST = "/no records found|record not found/i.test(document.body ? document.body.innerText : '')"
+_NO_RECORDS_JS = f"return {_NO_RECORDS_TEST};"
+
+# True once the results table or a "no records" message is on the page
+_RESULTS_READY_JS = f"return !!document.getElementById('dgResults') || {_NO_RECORDS_TEST};"
+
+
+# Results container text plus the trimmed cells of each 2+ column row
+_RESULTS_TABLE_FN = """container => ({
+    text: container.innerText,
+    rows: [...container.querySelectorAll('tr')]
+        .map(row => [...row.querySelectorAll('td')].map(cell => cell.innerText.trim()))
+        .filter(cells => cells.length >= 2)
+})"""
+_RESULTS_TABLE_JS = f"return ({_RESULTS_TABLE_FN})(arguments[0]);"
+
+# Result fields matched against the first cell of each results row
+_RESULT_FIELD_MAPPINGS = {
+    "uen": ["uen"],
+    "status": ["status"],
+    "gst_registration": ["gst"],
+}
+
+# Same mapping keyed by alias, so each row is checked against a flat list
+_RESULT_FIELD_ALIASES = {
+    alias: standard_name
+    for standard_name, aliases in _RESULT_FIELD_MAPPINGS.items()
+    for alias in aliases
+}
+
+
+# "Search Again" button on the IRAS results page
+_SEARCH_AGAIN_SELECTORS = (
+    (By.ID, "btnSearchAgain"),
+    (By.CSS_SELECTOR, "input[value*='SEARCH AGAIN']"),
+    (By.CSS_SELECTOR, "input[name*='SearchAgain']"),
+    (By.XPATH, "//input[@value='SEARCH AGAIN' or contains(@value, 'Search Again')]")
+)
+
+# ReCAPTCHA checkbox inside the anchor iframe (any match)
+_CHECKBOX_SELECTOR = (
+    ".recaptcha-checkbox-border, .recaptcha-checkbox, "
+    "#recaptcha-anchor, div[role='checkbox']"
+)
+
+# Audio challenge button inside the challenge iframe
+_AUDIO_BUTTON_SELECTORS = (
+    "#recaptcha-audio-button",  # Primary audio button ID
+    "button[id*='audio']",      # Button with audio in ID
+    "button[title*='audio']",   # Button with audio in title
+    "button[aria-label*='audio']",  # Button with audio in aria-label
+    ".rc-button-audio",         # Audio button class
+    "button[class*='audio']",   # Button with audio in class name
+)
+
+# Elements present once the audio challenge has loaded
+_AUDIO_CHALLENGE_SELECTORS = (
+    "audio",                    # HTML5 audio element
+    ".rc-audiochallenge",      # Audio challenge container
+    "#audio-source",           # Audio source element
+    "button[title*='Play']",   # Play button
+)
+
+# Image challenge elements inside the challenge iframe
+_IMAGE_CHALLENGE_SELECTORS = (
+    ".rc-imageselect-target",  # Main image selection area
+    ".rc-image-tile-wrapper",  # Individual image tiles
+    ".rc-imageselect-instructions",  # Challenge instructions
+    "table[class*='rc-imageselect']",  # Image selection table
+)
+
+# The challenge selector lists joined once into grouped CSS selectors
+_AUDIO_BUTTON_CSS = ", ".join(_AUDIO_BUTTON_SELECTORS)
+_AUDIO_CHALLENGE_CSS = ", ".join(_AUDIO_CHALLENGE_SELECTORS)
+_IMAGE_CHALLENGE_CSS = ", ".join(_IMAGE_CHALLENGE_SELECTORS)
+
+# Image challenge wording in the challenge iframe text, matched in one pass
+_CHALLENGE_TEXT_RE = re.compile(r"select all|click on|images|traffic lights|crosswalks|vehicles", re.I)
+
+# UEN input field on the IRAS search page
+_UEN_INPUT_SELECTORS = (
+    (By.ID, "txtKeyword"),  # Primary IRAS selector
+    (By.CSS_SELECTOR, "input[name*='txtKeyword'], input[placeholder*='UEN']"),  # ASP.NET/generic fallbacks
+)
+
+# Search button on the IRAS search page
+_SEARCH_BUTTON_SELECTORS = (
+    (By.ID, "btnSearch"),  # Primary IRAS selector
+    (By.CSS_SELECTOR, "input[value*='SEARCH'], input[type='submit']"),  # Value-based/generic submit fallbacks
+)
+
+# Results table on the IRAS results page
+_RESULTS_CONTAINER_SELECTORS = (
+    (By.ID, "dgResults"),  # Primary IRAS results table
+    (By.CSS_SELECTOR, "table[id*='result']"),  # Generic results table
+    (By.TAG_NAME, "table"),  # Any table fallback
+)
+
+
+def _write_screenshot(path: Path, png: bytes):
+    """Write a captured PNG to disk (runs on the screenshot thread)."""
+    path.write_bytes(png)
+
+
+def _parse_results(results_text: str, rows: List[List[str]]) -> Dict[str, str]:
+    """Map results-table rows (or raw text) onto the scraper's result fields."""
+    data = {"raw_results": results_text.strip()}
+    
+    for cells in rows:
+        field_name = cells[0].lower()
+        # A label can fill several fields ("GST Registration Status" sets
+        # both gst_registration and status); later rows overwrite earlier ones
+        for alias, standard_name in _RESULT_FIELD_ALIASES.items():
+            if alias in field_name:
+                data[standard_name] = cells[1]
+    
+    # Simple pattern matching for key fields
+    if len(data) == 1:
+        for line in data["raw_results"].split('\n'):
+            if "not registered" in line.lower():
+                data["gst_registration"] = "Not registered"
+            elif "registered" in line.lower() and "from" in line.lower():
+                data["gst_registration"] = "Registered"
+    
+    return data
+
+
+def _prefer_selector(preferred: Optional[Tuple[str, str]],
+                     selectors: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Order selectors with a previously successful one first."""
+    if preferred is None:
+        return selectors
+    return (preferred,) + tuple(selector for selector in selectors if selector != preferred)
+
+
+def _poll_with_backoff(check: Callable[[], Any], timeout: float,
+                       interval: float = 0.1, max_interval: float = 0.5) -> Any:
+    """Call check until it returns something truthy, doubling the pause each time.
+    
+    Returns:
+        The first truthy result, or None once timeout seconds have passed
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = check()
+        if result or time.monotonic() >= deadline:
+            return result or None
+        time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+        interval = min(interval * 2, max_interval)
+
+
+class _RequestSchedule:
+    """Earliest start of the next search, shared by scrapers that pace together."""
+    
+    def __init__(self, shared_next_time=None):
+        """Initialize the schedule.
+        
+        Args:
+            shared_next_time: Optional multiprocessing.Value('d') holding the
+                next start time, to pace scrapers in several processes
+        """
+        self._shared = shared_next_time
+        self._lock = shared_next_time.get_lock() if shared_next_time is not None else threading.Lock()
+        self._local_next_time = 0.0
+    
+    @property
+    def _next_time(self) -> float:
+        return self._shared.value if self._shared is not None else self._local_next_time
+    
+    @_next_time.setter
+    def _next_time(self, value: float):
+        if self._shared is not None:
+            self._shared.value = value
+        else:
+            self._local_next_time = value
+    
+    def reserve(self, spacing: float) -> float:
+        """Claim the next start slot and keep the one after it spacing seconds later.
+        
+        Returns:
+            Seconds to wait before starting the search
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + spacing
+            return start - now
+    
+    def finished(self, spacing: float):
+        """Keep the next start at least spacing seconds after a search ended."""
+        with self._lock:
+            self._next_time = max(self._next_time, time.monotonic() + spacing)
+
+
+class _results_or_no_records:
+    """Expected condition: the search has produced results or a "no records" message."""
+    
+    def __call__(self, driver) -> bool:
+        return driver.execute_script(_RESULTS_READY_JS)
+
+
+@functools.lru_cache(maxsize=1)
+def _managed_chromedriver_path() -> str:
+    """Resolve (and download if needed) ChromeDriver once per process."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    return ChromeDriverManager().install()
 
 
 class IRASScraper:
     """Main scraper class for IRAS website with ReCAPTCHA v2 solving."""
     
-    def __init__(self, config: Config = None):
+    def __init__(self, config: Config = None, pool: BrowserPool = None):
         """Initialize the IRAS scraper.
         
         Args:
             config: Configuration object (uses default if None)
+            pool: Optional browser pool to borrow drivers from instead of
+                launching a new Chrome per session
         """
         self.config = config or Config()
+        self.pool = pool
         self.driver = None
         self.wait = None
         self.solver = None
+        self._screenshot_pool = None
+        if self.config.DEBUG_SCREENSHOTS:
+            # Created once here rather than on every screenshot write
+            SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        # ReCAPTCHA iframes of the current page, reused across solving steps
+        self._anchor_cache = None
+        self._bframe_cache = None
+        # Challenge shown after the last audio switch ("audio"/"image"), None if unknown
+        self._last_challenge_kind = None
+        # Request spacing, shared with the worker scrapers of a parallel batch
+        self._request_schedule = _RequestSchedule()
+        # Set once a search has typed into or solved the ReCAPTCHA on the
+        # current search page; cleared only when a new page has loaded
+        self._search_form_used = False
+        # Locators that matched on the previous search, tried first next time
+        self._uen_input_selector = None
+        self._search_button_selector = None
         self.logger = self._setup_logging()
         
     def _setup_logging(self) -> logging.Logger:
@@ -44,11 +389,8 @@ class IRASScraper:
         logger = logging.getLogger(__name__)
         
         if not logger.handlers:
-            # Create logs directory if it doesn't exist
-            import os
-            os.makedirs("logs", exist_ok=True)
-            
-            # File handler
+            # File handler (create the log directory if it doesn't exist)
+            Path(self.config.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(self.config.LOG_FILE)
             file_handler.setLevel(getattr(logging, self.config.LOG_LEVEL))
             
@@ -84,6 +426,15 @@ class IRASScraper:
             chrome_options.add_argument("--disable-domain-reliability")
             chrome_options.add_argument("--disable-background-networking")
             
+            # Skip bandwidth-only features (images, CSS and JS stay on for the CAPTCHA)
+            chrome_options.add_argument(
+                "--disable-features=InterestFeedContentSuggestions,Translate,OptimizationHints,MediaRouter"
+            )
+            chrome_options.add_argument("--safebrowsing-disable-auto-update")
+            
+            # Larger HTTP cache so pooled drivers reuse IRAS/ReCAPTCHA assets
+            chrome_options.add_argument("--disk-cache-size=104857600")
+            
             # Set realistic window size with slight randomization
             if not self.config.HEADLESS:
                 base_width, base_height = self.config.WINDOW_SIZE.split(',')
@@ -118,6 +469,10 @@ class IRASScraper:
             }
             chrome_options.add_experimental_option("prefs", prefs)
             
+            # Return from get() at DOMContentLoaded; images and CSS keep
+            # loading for the CAPTCHA without blocking navigation
+            chrome_options.page_load_strategy = "eager"
+            
             # Initialize driver with manual or automatic ChromeDriver
             if self.config.CHROMEDRIVER_PATH:
                 # Use manually specified ChromeDriver path
@@ -130,26 +485,23 @@ class IRASScraper:
             else:
                 # Automatic ChromeDriver download (default behavior)
                 self.logger.info("Automatically downloading ChromeDriver")
-                service = webdriver.chrome.service.Service(ChromeDriverManager().install())
+                service = webdriver.chrome.service.Service(_managed_chromedriver_path())
             
-            driver = webdriver.Chrome(
-                service=service,
-                options=chrome_options
-            )
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Keep more connections open to chromedriver
+            self._tune_connection_pool(driver)
             
-            # Apply lightweight stealth scripts
-            self._apply_stealth_scripts(driver)
+            # Stealth, viewport and ReCAPTCHA probe scripts on every page
+            self._install_page_scripts(driver)
             
-            # Set realistic timeouts with slight randomization
-            implicit_wait = self.config.IMPLICIT_WAIT + random.uniform(-0.5, 0.5)
+            # Explicit waits only: an implicit wait would stall every
+            # find_elements() probe for a missing element
             page_load_timeout = self.config.PAGE_LOAD_TIMEOUT + random.uniform(-1, 1)
             
-            driver.implicitly_wait(max(2, implicit_wait))
+            driver.implicitly_wait(0)
             driver.set_page_load_timeout(max(10, page_load_timeout))
             
-            # Set realistic viewport
-            self._set_realistic_viewport(driver)
-            
             self.logger.info("Chrome WebDriver initialized with CAPTCHA-friendly settings")
             return driver
             
@@ -157,66 +509,143 @@ class IRASScraper:
             self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
             raise
     
-    def _apply_stealth_scripts(self, driver):
-        """Apply lightweight CAPTCHA-friendly anti-detection JavaScript."""
-        stealth_js = """
-        // Remove primary webdriver detection
-        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-        
-        // Clean Chrome automation variables (most critical ones only)
-        ['cdc_adoQpoasnfa76pfcZLmcfl_Array', 'cdc_adoQpoasnfa76pfcZLmcfl_Promise', 
-         'cdc_adoQpoasnfa76pfcZLmcfl_Symbol'].forEach(prop => delete window[prop]);
+    def _tune_connection_pool(self, driver):
+        """Raise the urllib3 pool size used for WebDriver commands.
         
-        // Fix chrome.runtime detection (key for Google services)
-        if (window.chrome) {
-            window.chrome.runtime = window.chrome.runtime || {};
-            Object.defineProperty(window.chrome.runtime, 'onConnect', {value: undefined});
-        }
+        Selenium's default pool holds a single connection, so bursts of
+        commands queue up and log "connection pool is full" warnings. The
+        pool manager is private Selenium 4 state, so other versions are left
+        untouched.
         """
+        pool_manager = getattr(driver.command_executor, "_conn", None)
+        if _SELENIUM_MAJOR != 4 or not isinstance(pool_manager, urllib3.PoolManager):
+            self.logger.debug(f"WebDriver connection pool left at defaults for Selenium {selenium.__version__}")
+            return
+        
+        try:
+            pool_manager.connection_pool_kw.update(
+                maxsize=self.config.WEBDRIVER_POOL_MAXSIZE,
+                block=False
+            )
+            # Drop pools created during session start so new ones pick up maxsize
+            pool_manager.clear()
+            self.logger.debug(f"WebDriver connection pool maxsize set to {self.config.WEBDRIVER_POOL_MAXSIZE}")
+        except Exception as e:
+            self.logger.debug(f"Could not resize WebDriver connection pool: {e}")
+    
+    def _install_page_scripts(self, driver):
+        """Register stealth, viewport and ReCAPTCHA probe scripts for every new document.
         
+        All three are sent as one CDP Page.addScriptToEvaluateOnNewDocument
+        payload, so Chrome injects them on each navigation without extra
+        WebDriver round-trips. The viewport script is left out in headless
+        mode. Falls back to running them on the current page when CDP is
+        unavailable.
+        """
+        page_scripts = _HEADLESS_PAGE_SCRIPTS_JS if self.config.HEADLESS else _PAGE_SCRIPTS_JS
         try:
-            # Use CDP for most effective injection
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': stealth_js})
-            self.logger.debug("Applied lightweight stealth scripts via CDP")
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': page_scripts})
+            self.logger.debug("Installed stealth, viewport and ReCAPTCHA probe scripts via CDP")
         except Exception as e:
+            self.logger.debug(f"CDP unavailable for page scripts ({e}), running them on the current page")
             try:
-                driver.execute_script(stealth_js)
-                self.logger.debug("Applied stealth scripts via execute_script")
+                driver.execute_script(page_scripts)
+                self.logger.debug("Applied page scripts via execute_script")
             except Exception as e2:
-                self.logger.warning(f"Failed to apply stealth scripts: {e2}")
+                self.logger.warning(f"Failed to apply page scripts: {e2}")
     
-    def _set_realistic_viewport(self, driver):
-        """Set realistic viewport and screen properties."""
-        viewport_js = """
-        // Set realistic viewport
-        const viewport = {
-            width: window.screen.width,
-            height: window.screen.height,
-            deviceScaleFactor: window.devicePixelRatio || 1
-        };
+    def _cdp_eval(self, expression: str) -> Any:
+        """Evaluate a JavaScript expression in the top-level page via CDP.
         
-        // Add slight randomization to timing functions
-        const originalSetTimeout = window.setTimeout;
-        window.setTimeout = function(fn, delay) {
-            const randomDelay = delay + (Math.random() * 10 - 5);
-            return originalSetTimeout(fn, Math.max(0, randomDelay));
-        };
+        Runtime.evaluate skips the W3C command layer of execute_script;
+        falls back to execute_script when CDP is unavailable.
+        """
+        try:
+            response = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+            )
+        except WebDriverException:
+            return self.driver.execute_script(f"return {expression};")
+        if "exceptionDetails" in response:
+            raise WebDriverException(response["exceptionDetails"].get("text", "JavaScript error"))
+        return response["result"].get("value")
+    
+    def _find_recaptcha(self) -> Dict[str, Any]:
+        """Inspect ReCAPTCHA iframes, containers and response tokens in one call.
         
-        // Mock realistic mouse movements
-        let mouseX = Math.floor(Math.random() * window.innerWidth);
-        let mouseY = Math.floor(Math.random() * window.innerHeight);
+        Returns:
+            Dictionary with 'frames' (iframe srcs), 'containers' (count) and
+            'tokens' (g-recaptcha-response value lengths)
+        """
+        return self._cdp_eval(f"(window.__findRecaptcha || ({_RECAPTCHA_PROBE_JS}))()")
+    
+    def _find_recaptcha_elements(self) -> Dict[str, List[Any]]:
+        """Find ReCAPTCHA iframes and containers with a single execute_script.
         
-        document.addEventListener('mousemove', (e) => {
-            mouseX = e.clientX;
-            mouseY = e.clientY;
-        });
+        Returns:
+            Dictionary of WebElement lists: 'frames' (all ReCAPTCHA iframes),
+            'anchors' (checkbox iframes), 'challenges' (challenge iframes)
+            and 'containers'
         """
+        return self.driver.execute_script(_RECAPTCHA_ELEMENTS_JS)
+    
+    def _locate_recaptcha_iframes(self, found: Dict[str, List[Any]] = None):
+        """Cache the checkbox and challenge iframes for the current CAPTCHA.
+        
+        Args:
+            found: Result of _find_recaptcha_elements() (looked up when None)
+        """
+        found = found or self._find_recaptcha_elements()
+        self._anchor_cache = next(iter(found["anchors"]), None)
+        self._bframe_cache = next(iter(found["challenges"]), None)
+        self._last_challenge_kind = None
+    
+    def _invalidate_recaptcha_iframes(self):
+        """Forget cached ReCAPTCHA iframes (after navigation or a stale frame)."""
+        self._anchor_cache = None
+        self._bframe_cache = None
+        self._last_challenge_kind = None
+    
+    def _checkbox_iframe(self) -> Optional[Any]:
+        """Checkbox (anchor) iframe element, looked up only until one has been cached."""
+        if self._anchor_cache is None:
+            self._anchor_cache = next(iter(self.driver.find_elements(By.CSS_SELECTOR, RECAPTCHA_ANCHOR_SELECTOR)), None)
+        return self._anchor_cache
+    
+    def _challenge_iframe(self) -> Optional[Any]:
+        """Challenge (bframe) iframe element, looked up only until one has been cached.
+        
+        The challenge iframe is often injected after the checkbox click, so
+        a missing iframe is not cached.
+        """
+        if self._bframe_cache is None:
+            self._bframe_cache = next(iter(self.driver.find_elements(By.CSS_SELECTOR, RECAPTCHA_CHALLENGE_SELECTOR)), None)
+        return self._bframe_cache
+    
+    def _switch_to_recaptcha_frame(self, locate: Callable[[], Optional[Any]]) -> bool:
+        """Switch into a cached ReCAPTCHA iframe by its WebElement.
+        
+        If the cached element went stale, the cache is dropped and the
+        iframe located again once.
         
+        Args:
+            locate: _checkbox_iframe or _challenge_iframe
+            
+        Returns:
+            True if the driver is now inside the iframe, False if none exists
+        """
+        frame = locate()
+        if frame is None:
+            return False
         try:
-            driver.execute_script(viewport_js)
-            self.logger.debug("Set realistic viewport properties")
-        except Exception as e:
-            self.logger.warning(f"Failed to set viewport properties: {e}")
+            self.driver.switch_to.frame(frame)
+        except StaleElementReferenceException:
+            self._invalidate_recaptcha_iframes()
+            frame = locate()
+            if frame is None:
+                return False
+            self.driver.switch_to.frame(frame)
+        return True
     
     def _simulate_human_page_interaction(self):
         """Simulate human-like page interactions before ReCAPTCHA."""
@@ -225,21 +654,32 @@ class IRASScraper:
             actions = ActionChains(self.driver)
             
             # Simulate reading the page by scrolling slightly
-            self.driver.execute_script("window.scrollBy(0, Math.random() * 100);")
-            time.sleep(random.uniform(0.3, 0.8))
+            self._scroll_sequence([(random.randint(0, 100), self._jitter_delay(0.3, 0.8))])
             
             # Random cursor movement to simulate human behavior
             body = self.driver.find_element(By.TAG_NAME, "body")
             actions.move_to_element_with_offset(body, 
                 random.randint(100, 400), random.randint(100, 300)).perform()
             
-            time.sleep(random.uniform(0.2, 0.5))
+            self._jitter(0.2, 0.5)
             
         except Exception as e:
             self.logger.debug(f"Could not simulate human interaction: {str(e)}")
 
     def _human_like_click(self, element):
-        """Perform a human-like click with realistic timing and movement."""
+        """Click an element, with realistic pointer movement when HUMAN_LIKE_CLICK is set.
+        
+        By default the click is dispatched in the page (one WebDriver
+        round-trip); the ActionChains path moves a real pointer for widgets
+        that only accept trusted pointer events.
+        """
+        if not self.config.HUMAN_LIKE_CLICK:
+            try:
+                self.driver.execute_script("arguments[0].click();", element)
+                return
+            except WebDriverException as e:
+                self.logger.debug(f"JavaScript click failed, using pointer click: {str(e)}")
+        
         try:
             # Move to element with slight randomization
             actions = ActionChains(self.driver)
@@ -247,13 +687,13 @@ class IRASScraper:
                 random.randint(-3, 3), random.randint(-3, 3))
             
             # Add small pause before click (human hesitation)
-            time.sleep(random.uniform(0.1, 0.3))
+            self._jitter(0.1, 0.3)
             
             # Perform click
             actions.click().perform()
             
             # Brief pause after click
-            time.sleep(random.uniform(0.2, 0.5))
+            self._jitter(0.2, 0.5)
             
         except Exception as e:
             self.logger.debug(f"Human-like click failed, using regular click: {str(e)}")
@@ -263,43 +703,63 @@ class IRASScraper:
     def _manage_session_state(self):
         """Manage browser session to appear more human-like."""
         try:
+            # Cookie resets and side trips cost full page loads; opt-in only
+            simulate_browsing = self.config.SIMULATE_BROWSING
+            
             # Clear some cookies randomly to simulate human behavior
-            if random.random() < 0.3:  # 30% chance
+            if simulate_browsing and random.random() < 0.3:  # 30% chance
                 self.driver.delete_all_cookies()
                 self.logger.debug("Cleared cookies for session reset")
             
             # Simulate browsing other pages occasionally
-            if random.random() < 0.2:  # 20% chance
+            if simulate_browsing and random.random() < 0.2:  # 20% chance
                 self.logger.debug("Simulating browsing behavior")
                 # Visit IRAS homepage briefly
                 self.driver.get("https://www.iras.gov.sg/")
-                time.sleep(random.uniform(2, 5))
+                self._jitter(2, 5)
                 
                 # Then navigate back to target page
                 self.driver.get("https://www.iras.gov.sg/taxes/corporate-income-tax/income-deduction-for-expenses/business-expenses/gst-registered-suppliers")
-                time.sleep(random.uniform(3, 6))
+                self._jitter(3, 6)
             
             # Add random scrolling to simulate reading
-            scroll_pause = random.uniform(0.5, 2.0)
+            scroll_pause = self._jitter_delay(0.5, 2.0)
             scroll_amount = random.randint(100, 500)
             
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount}); ")
-            time.sleep(scroll_pause)
-            
-            self.driver.execute_script(f"window.scrollBy(0, -{scroll_amount // 2}); ")
-            time.sleep(scroll_pause)
+            self._scroll_sequence([
+                (scroll_amount, scroll_pause),
+                (-(scroll_amount // 2), scroll_pause),
+            ])
             
         except Exception as e:
             self.logger.debug(f"Session management failed: {e}")
     
+    def _scroll_sequence(self, steps: List[Tuple[int, float]]):
+        """Scroll by each (pixels, pause seconds) step inside the browser.
+        
+        The whole sequence, pauses included, runs as one async script on
+        animation frames, so it costs a single WebDriver round-trip.
+        """
+        self.driver.execute_async_script(
+            _SCROLL_SEQUENCE_JS, [[dy, int(pause * 1000)] for dy, pause in steps]
+        )
+    
     def start_session(self):
         """Start a new scraping session."""
         try:
-            self.driver = self._setup_driver()
+            if self.pool:
+                self.driver = self.pool.acquire()
+            else:
+                self.driver = self._setup_driver()
             self.wait = WebDriverWait(self.driver, 10)
             
             # Initialize ReCAPTCHA solver (if available)
-            if RECAPTCHA_SOLVER_AVAILABLE:
+            try:
+                from selenium_recaptcha_solver import RecaptchaSolver
+            except ImportError:
+                RecaptchaSolver = None
+            
+            if RecaptchaSolver is not None:
                 self.solver = RecaptchaSolver(driver=self.driver)
                 
                 # Check ffmpeg availability for audio CAPTCHA solving
@@ -309,26 +769,39 @@ class IRASScraper:
                     self.logger.info("ffmpeg found - full audio CAPTCHA solving enabled")
             else:
                 self.solver = None
-                self.logger.warning("ReCAPTCHA solver not available - manual solving may be required")
+                self.logger.warning("ReCAPTCHA solver not available - manual solving may be required. Install with: uv sync --extra recaptcha")
             
             self.logger.info("Scraping session started successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to start session: {str(e)}")
-            self.close_session()
+            self.close_session(discard=True)
             raise
     
-    def close_session(self):
-        """Close the scraping session and cleanup resources."""
+    def close_session(self, discard: bool = False):
+        """Close the scraping session and cleanup resources.
+        
+        Args:
+            discard: When using a pool, quit the driver instead of returning it
+        """
         if self.driver:
             try:
-                self.driver.quit()
-                self.logger.info("WebDriver session closed")
+                if self.pool:
+                    self.pool.release(self.driver, discard=discard)
+                    self.logger.info("WebDriver returned to browser pool")
+                else:
+                    self.driver.quit()
+                    self.logger.info("WebDriver session closed")
             except Exception as e:
                 self.logger.warning(f"Error closing WebDriver: {str(e)}")
             finally:
                 self.driver = None
                 self.wait = None
+        
+        # Finish writing any queued debug screenshots
+        if self._screenshot_pool is not None:
+            self._screenshot_pool.shutdown(wait=True)
+            self._screenshot_pool = None
     
     def navigate_to_iras(self) -> bool:
         """Navigate to IRAS website.
@@ -336,12 +809,20 @@ class IRASScraper:
         Returns:
             True if navigation successful, False otherwise
         """
+        self._invalidate_recaptcha_iframes()
         try:
+            if self._on_fresh_search_page():
+                self.logger.info("Already on IRAS search page, skipping reload")
+                return True
+            
+            if self._back_to_search_form():
+                self.logger.info("Returned to IRAS search page via history, skipping reload")
+                return True
+            
             self.logger.info(f"Navigating to IRAS website: {self.config.IRAS_URL}")
+            # Eager page loading returns once the DOM (including body) is ready
             self.driver.get(self.config.IRAS_URL)
-            
-            # Wait for page to load
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            self._search_form_used = False
             
             # Check if we're on a results page instead of the search page
             current_url = self.driver.current_url
@@ -350,33 +831,35 @@ class IRASScraper:
             if "MGSTListingResult" in current_url or "Search Result" in page_title:
                 self.logger.info("Currently on results page, attempting to go back to search")
                 try:
-                    # Try to find and click "Search Again" button
-                    search_again_selectors = [
-                        (By.ID, "btnSearchAgain"),
-                        (By.CSS_SELECTOR, "input[value*='SEARCH AGAIN']"),
-                        (By.CSS_SELECTOR, "input[name*='SearchAgain']"),
-                        (By.XPATH, "//input[@value='SEARCH AGAIN' or contains(@value, 'Search Again')]")
-                    ]
-                    
-                    for selector_type, selector_value in search_again_selectors:
-                        try:
-                            search_again_btn = self.wait.until(
-                                EC.element_to_be_clickable((selector_type, selector_value))
-                            )
-                            search_again_btn.click()
-                            self.logger.info("Clicked 'Search Again' button")
-                            
-                            # Wait for navigation back to search page
-                            WebDriverWait(self.driver, 10).until(
-                                lambda driver: "MGSTSearch" in driver.current_url or "Search" in driver.title
+                    # Find the "Search Again" button; one short poll tries every selector per tick
+                    try:
+                        search_again_btn = WebDriverWait(
+                            self.driver, 3, poll_frequency=0.25,
+                            ignored_exceptions=(StaleElementReferenceException,)
+                        ).until(
+                            lambda driver: next(
+                                (
+                                    element
+                                    for selector in _SEARCH_AGAIN_SELECTORS
+                                    for element in driver.find_elements(*selector)
+                                    if element.is_displayed() and element.is_enabled()
+                                ),
+                                None
                             )
-                            self.logger.info("Successfully navigated back to search page")
-                            break
-                        except TimeoutException:
-                            continue
-                        except Exception as e:
-                            self.logger.debug(f"Search Again selector failed: {e}")
-                            continue
+                        )
+                    except TimeoutException:
+                        search_again_btn = None
+                        self.logger.warning("'Search Again' button not found")
+                    
+                    if search_again_btn:
+                        search_again_btn.click()
+                        self.logger.info("Clicked 'Search Again' button")
+                        
+                        # Wait for navigation back to search page
+                        WebDriverWait(self.driver, 10).until(
+                            lambda driver: "MGSTSearch" in driver.current_url or "Search" in driver.title
+                        )
+                        self.logger.info("Successfully navigated back to search page")
                 except Exception as e:
                     self.logger.warning(f"Could not navigate back to search page: {e}")
             
@@ -390,6 +873,48 @@ class IRASScraper:
             self.logger.error(f"Error navigating to IRAS website: {str(e)}")
             return False
     
+    def _back_to_search_form(self) -> bool:
+        """Go back from a results page to the search form it was posted from.
+        
+        Returning through history lets Chrome restore the form from its
+        caches instead of a full page load. The restored form is only used
+        when _on_fresh_search_page() accepts it: a form brought back with
+        its spent ReCAPTCHA token still filled in is reloaded as usual.
+        
+        Returns:
+            True if the driver now shows a fresh search form, False otherwise
+        """
+        try:
+            if "MGSTListingResult" not in self.driver.current_url and "Search Result" not in self.driver.title:
+                return False
+            self.driver.execute_script("history.back();")
+            WebDriverWait(self.driver, 5).until(EC.presence_of_element_located((By.ID, "txtKeyword")))
+        except (TimeoutException, WebDriverException) as e:
+            self.logger.debug(f"History navigation back to search form failed: {str(e)}")
+            return False
+        # A document from history, not the page the last search left behind
+        self._search_form_used = False
+        return self._on_fresh_search_page()
+    
+    def _on_fresh_search_page(self) -> bool:
+        """Check whether the driver already shows an unused IRAS search form.
+        
+        The form must be loaded from IRAS_URL, not be a results postback, and
+        carry no ReCAPTCHA token from an earlier search (tokens are single-use).
+        A page a search has already worked on is never reused, even without a
+        token: a failed solve can leave an image or audio challenge open.
+        """
+        if self._search_form_used:
+            return False
+        try:
+            if self.driver.current_url != self.config.IRAS_URL or "Search Result" in self.driver.title:
+                return False
+            if not self.driver.find_elements(By.ID, "txtKeyword"):
+                return False
+            return not any(self._find_recaptcha()["tokens"])
+        except WebDriverException:
+            return False
+    
     def solve_recaptcha(self) -> bool:
         """Solve ReCAPTCHA v2 with advanced anti-detection measures.
         
@@ -400,16 +925,25 @@ class IRASScraper:
             self.logger.info("Attempting to solve ReCAPTCHA with anti-detection")
             
             # Brief human-like delay before CAPTCHA interaction
-            delay = random.uniform(2, 4)
+            delay = self._jitter_delay(2, 4)
             self.logger.info(f"Waiting {delay:.1f}s before CAPTCHA interaction...")
             time.sleep(delay)
             
-            # Look for ReCAPTCHA iframe with more detailed search
-            recaptcha_frames = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha']")
-            self.logger.info(f"Found {len(recaptcha_frames)} ReCAPTCHA iframes")
+            # Wait briefly for a ReCAPTCHA iframe to be injected; each poll
+            # collects iframes and containers in one round-trip
+            def recaptcha_loaded(driver):
+                found = self._find_recaptcha_elements()
+                return found if found["frames"] else False
+            
+            try:
+                recaptcha_elements = WebDriverWait(self.driver, RECAPTCHA_PRESENCE_TIMEOUT).until(recaptcha_loaded)
+            except TimeoutException:
+                recaptcha_elements = self._find_recaptcha_elements()
             
-            # Also check for any ReCAPTCHA containers
-            recaptcha_containers = self.driver.find_elements(By.CSS_SELECTOR, ".g-recaptcha")
+            self._locate_recaptcha_iframes(recaptcha_elements)
+            recaptcha_frames = recaptcha_elements["frames"]
+            recaptcha_containers = recaptcha_elements["containers"]
+            self.logger.info(f"Found {len(recaptcha_frames)} ReCAPTCHA iframes")
             self.logger.info(f"Found {len(recaptcha_containers)} ReCAPTCHA containers")
             
             if not recaptcha_frames and not recaptcha_containers:
@@ -431,19 +965,17 @@ class IRASScraper:
                 if main_iframe:
                     self.logger.info("Using RecaptchaSolver.click_recaptcha_v2() for checkbox click")
                     self.solver.click_recaptcha_v2(iframe=main_iframe)
-                    time.sleep(3)
                     
                     # Check if automated click solved it completely (no challenge appeared)
-                    if self._verify_recaptcha_solved():
+                    if self._wait_for_recaptcha_solved(3):
                         self.logger.info("ReCAPTCHA solved with automated checkbox click - no challenge appeared")
                         return True
                 else:
                     self.logger.warning("No ReCAPTCHA iframe found for automated clicking")
                     # Fallback to manual click method
                     self._try_manual_recaptcha_click()
-                    time.sleep(3)
                     
-                    if self._verify_recaptcha_solved():
+                    if self._wait_for_recaptcha_solved(3):
                         self.logger.info("ReCAPTCHA solved with manual click fallback - no challenge appeared")
                         return True
                         
@@ -451,28 +983,16 @@ class IRASScraper:
                 self.logger.warning(f"Automated checkbox click failed: {str(e)}, falling back to manual click")
                 # Fallback to manual click method
                 self._try_manual_recaptcha_click()
-                time.sleep(3)
                 
-                if self._verify_recaptcha_solved():
+                if self._wait_for_recaptcha_solved(3):
                     self.logger.info("ReCAPTCHA solved with manual click fallback - no challenge appeared")
                     return True
             
-            # Check if image challenge appeared after clicking
-            if self._detect_image_challenge():
-                self.logger.info("ReCAPTCHA image challenge detected. Attempting to switch to audio challenge...")
-                
-                # Try to switch to audio challenge
-                if self._switch_to_audio_challenge():
-                    self.logger.info("Successfully switched to audio challenge")
-                    # Continue with automated audio solving below
-                else:
-                    self.logger.warning("Could not switch to audio challenge")
-                    return False
-            
             # Save a screenshot for debugging before attempting to solve
             self._save_debug_screenshot("recaptcha_before_solve")
             
-            # Try automated solving with selenium-recaptcha-solver (audio method)
+            # Challenge phase: each attempt switches an image challenge to audio
+            # itself, so there is no separate probe before the loop
             if self.solver:
                 for attempt in range(self.config.RECAPTCHA_MAX_RETRIES):
                     try:
@@ -486,16 +1006,14 @@ class IRASScraper:
                                 continue
                         
                         # Add randomized delay to avoid detection
-                        delay = random.uniform(2, 4)
+                        delay = self._jitter_delay(2, 4)
                         self.logger.info(f"Waiting {delay:.2f} seconds before solving attempt")
                         time.sleep(delay)
                         
                         # Find the appropriate iframe for solving
-                        solving_iframe = None
                         # Try challenge iframe first (for audio challenges)
-                        challenge_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/bframe']")
-                        if challenge_iframes:
-                            solving_iframe = challenge_iframes[0]
+                        solving_iframe = self._challenge_iframe()
+                        if solving_iframe is not None:
                             self.logger.info("Using challenge iframe for solving")
                         else:
                             # Fallback to original recaptcha frame
@@ -504,24 +1022,26 @@ class IRASScraper:
                         
                         # Solve using audio method with iframe parameter
                         self.logger.info("Calling automated ReCAPTCHA solver...")
+                        self._last_challenge_kind = None
                         self.solver.solve_recaptcha_v2_challenge(solving_iframe)
                         self.logger.info("ReCAPTCHA solver call completed")
                         
-                        # Wait and check if solved
-                        wait_time = random.uniform(5, 8)  # Longer wait for audio challenges
-                        self.logger.info(f"Waiting {wait_time:.2f} seconds for ReCAPTCHA to complete")
-                        time.sleep(wait_time)
+                        # Wait until solved (longer timeout for audio challenges)
+                        wait_time = random.uniform(5, 8)
+                        self.logger.info(f"Waiting up to {wait_time:.2f} seconds for ReCAPTCHA to complete")
+                        solved = self._wait_for_recaptcha_solved(wait_time)
                         
                         # Save screenshot after solve attempt
                         self._save_debug_screenshot(f"recaptcha_after_solve_attempt_{attempt + 1}")
                         
                         # Verify ReCAPTCHA is solved
-                        if self._verify_recaptcha_solved():
+                        if solved:
                             self.logger.info("ReCAPTCHA solved with automated audio solver")
                             return True
                             
                     except Exception as e:
                         self.logger.warning(f"ReCAPTCHA attempt {attempt + 1} failed: {str(e)}")
+                        self._invalidate_recaptcha_iframes()
                         
                         # Save error screenshot
                         self._save_debug_screenshot(f"recaptcha_error_attempt_{attempt + 1}")
@@ -529,9 +1049,9 @@ class IRASScraper:
                         # If Google detected automated queries, wait much longer
                         if "automated queries" in str(e).lower():
                             self.logger.info("Detected automation warning, waiting longer...")
-                            time.sleep(random.uniform(15, 25))
+                            self._jitter(15, 25)
                         else:
-                            time.sleep(random.uniform(3, 6))
+                            self._jitter(3, 6)
             
             # If we still have challenges, make one final attempt with audio
             if self._detect_image_challenge():
@@ -539,11 +1059,11 @@ class IRASScraper:
                 if self._switch_to_audio_challenge():
                     try:
                         self.logger.info("Final audio challenge solving attempt...")
-                        solving_iframe = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/bframe']")
-                        if solving_iframe:
-                            self.solver.solve_recaptcha_v2_challenge(solving_iframe[0])
-                            time.sleep(6)
-                            if self._verify_recaptcha_solved():
+                        solving_iframe = self._challenge_iframe()
+                        if solving_iframe is not None:
+                            self._last_challenge_kind = None
+                            self.solver.solve_recaptcha_v2_challenge(solving_iframe)
+                            if self._wait_for_recaptcha_solved(6):
                                 self.logger.info("ReCAPTCHA solved in final audio attempt")
                                 return True
                     except Exception as e:
@@ -562,48 +1082,46 @@ class IRASScraper:
         """Try to click ReCAPTCHA checkbox manually with human-like behavior."""
         try:
             # Add random delay before interacting (human behavior)
-            pre_delay = random.uniform(0.5, 2.0)
+            pre_delay = self._jitter_delay(0.5, 2.0)
             self.logger.debug(f"Waiting {pre_delay:.2f}s before ReCAPTCHA interaction")
             time.sleep(pre_delay)
             
             # Look for the ReCAPTCHA checkbox iframe
-            checkbox_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/anchor']")
-            self.logger.info(f"Found {len(checkbox_iframes)} ReCAPTCHA checkbox iframes")
-            
-            if checkbox_iframes:
+            if self._checkbox_iframe() is None:
+                self.logger.info("No ReCAPTCHA checkbox iframe found")
+            else:
                 # Simulate human-like page interaction before clicking ReCAPTCHA
                 self._simulate_human_page_interaction()
                 
                 self.logger.info("Attempting to switch to ReCAPTCHA checkbox iframe")
-                self.driver.switch_to.frame(checkbox_iframes[0])
+                if not self._switch_to_recaptcha_frame(self._checkbox_iframe):
+                    self.logger.warning("ReCAPTCHA checkbox iframe disappeared")
+                    return
                 try:
-                    # Try multiple selectors for the checkbox
-                    checkbox_selectors = [
-                        ".recaptcha-checkbox-border",
-                        ".recaptcha-checkbox",
-                        "#recaptcha-anchor",
-                        "div[role='checkbox']"
-                    ]
-                    
-                    checkbox = None
-                    for selector in checkbox_selectors:
-                        try:
-                            checkbox = WebDriverWait(self.driver, 3).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                            )
-                            self.logger.info(f"Found checkbox using selector: {selector}")
-                            break
-                        except TimeoutException:
-                            continue
+                    # Any of the known checkbox selectors, matched in one wait
+                    try:
+                        checkbox = WebDriverWait(self.driver, 5).until(
+                            EC.element_to_be_clickable((By.CSS_SELECTOR, _CHECKBOX_SELECTOR))
+                        )
+                    except TimeoutException:
+                        checkbox = None
                     
                     if checkbox:
                         # Human-like click with slight delay and movement
                         self._human_like_click(checkbox)
                         self.logger.info("Successfully clicked ReCAPTCHA checkbox")
                         
-                        # Random post-click delay
-                        post_delay = random.uniform(1.5, 3.5)
-                        time.sleep(post_delay)
+                        # Wait for the checkbox to tick; if a challenge opens instead
+                        # it stays unchecked and the caller handles the challenge
+                        try:
+                            WebDriverWait(self.driver, 3).until(
+                                EC.text_to_be_present_in_element_attribute(
+                                    (By.ID, "recaptcha-anchor"), "aria-checked", "true"
+                                )
+                            )
+                            self.logger.info("ReCAPTCHA checkbox is checked")
+                        except TimeoutException:
+                            self.logger.debug("ReCAPTCHA checkbox not checked after click")
                     else:
                         self.logger.warning("Could not find clickable ReCAPTCHA checkbox")
                         
@@ -627,68 +1145,39 @@ class IRASScraper:
         """
         try:
             # Random delay before switching (human thinking time)
-            thinking_delay = random.uniform(1.0, 3.0)
+            thinking_delay = self._jitter_delay(1.0, 3.0)
             self.logger.debug(f"Waiting {thinking_delay:.2f}s before switching to audio (human thinking)")
             time.sleep(thinking_delay)
             
-            # Look for challenge iframe
-            challenge_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/bframe']")
-            if not challenge_iframes:
+            # Switch to the challenge iframe
+            if not self._switch_to_recaptcha_frame(self._challenge_iframe):
                 self.logger.warning("No challenge iframe found")
                 return False
             
-            # Switch to challenge iframe
-            self.driver.switch_to.frame(challenge_iframes[0])
-            
             try:
-                # Look for audio button with multiple selectors
-                audio_selectors = [
-                    "#recaptcha-audio-button",  # Primary audio button ID
-                    "button[id*='audio']",      # Button with audio in ID
-                    "button[title*='audio']",   # Button with audio in title
-                    "button[aria-label*='audio']",  # Button with audio in aria-label
-                    ".rc-button-audio",         # Audio button class
-                    "button[class*='audio']",   # Button with audio in class name
-                ]
-                
-                audio_button = None
-                for selector in audio_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements and elements[0].is_displayed() and elements[0].is_enabled():
-                            audio_button = elements[0]
-                            self.logger.info(f"Found audio button using selector: {selector}")
-                            break
-                    except:
-                        continue
+                # First visible, enabled audio button candidate in one call
+                audio_button = self.driver.execute_script(_FIRST_USABLE_ELEMENT_JS, _AUDIO_BUTTON_CSS)
                 
                 if audio_button:
                     # Human-like click on audio button
                     self._human_like_click(audio_button)
                     self.logger.info("Clicked audio challenge button")
                     
-                    # Wait for audio challenge to load with randomization
-                    load_delay = random.uniform(1.5, 3.0)
-                    time.sleep(load_delay)
-                    
-                    # Verify audio challenge is loaded
-                    audio_challenge_selectors = [
-                        "audio",                    # HTML5 audio element
-                        ".rc-audiochallenge",      # Audio challenge container
-                        "#audio-source",           # Audio source element
-                        "button[title*='Play']",   # Play button
-                    ]
-                    
-                    for selector in audio_challenge_selectors:
-                        if self.driver.find_elements(By.CSS_SELECTOR, selector):
-                            self.logger.info(f"Audio challenge loaded - found: {selector}")
-                            return True
-                    
+                    # Wait for audio challenge to load, polling fast at first
+                    if _poll_with_backoff(
+                        lambda: self.driver.find_elements(By.CSS_SELECTOR, _AUDIO_CHALLENGE_CSS),
+                        self.config.ELEMENT_WAIT_TIMEOUT
+                    ):
+                        self.logger.info("Audio challenge loaded")
+                        self._last_challenge_kind = "audio"
+                        return True
                     self.logger.warning("Audio challenge button clicked but audio elements not found")
+                    self._last_challenge_kind = "image"
                     return False
                     
                 else:
                     self.logger.warning("Audio button not found in challenge iframe")
+                    self._last_challenge_kind = "image"
                     return False
                     
             finally:
@@ -696,6 +1185,7 @@ class IRASScraper:
                 
         except Exception as e:
             self.logger.error(f"Error switching to audio challenge: {str(e)}")
+            self._invalidate_recaptcha_iframes()
             try:
                 self.driver.switch_to.default_content()
             except:
@@ -705,40 +1195,30 @@ class IRASScraper:
     def _detect_image_challenge(self) -> bool:
         """Detect if ReCAPTCHA image challenge is currently shown.
         
+        Answers from the last audio switch attempt when the challenge has
+        not changed since, without entering the challenge iframe.
+        
         Returns:
             True if image challenge is visible, False otherwise
         """
+        if self._last_challenge_kind is not None:
+            return self._last_challenge_kind == "image"
+        
         try:
-            # Look for image challenge iframes
-            challenge_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/bframe']")
-            if not challenge_iframes:
-                return False
-            
             # Switch to challenge iframe to check for images
-            self.driver.switch_to.frame(challenge_iframes[0])
+            if not self._switch_to_recaptcha_frame(self._challenge_iframe):
+                return False
             try:
-                # Look for common image challenge elements
-                image_selectors = [
-                    ".rc-imageselect-target",  # Main image selection area
-                    ".rc-image-tile-wrapper",  # Individual image tiles
-                    ".rc-imageselect-instructions",  # Challenge instructions
-                    "table[class*='rc-imageselect']",  # Image selection table
-                ]
-                
-                for selector in image_selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        self.logger.info(f"Found image challenge element: {selector}")
-                        return True
+                # Look for any common image challenge element in one query
+                if self.driver.find_elements(By.CSS_SELECTOR, _IMAGE_CHALLENGE_CSS):
+                    self.logger.info("Found image challenge element")
+                    return True
                 
                 # Also check for challenge text
-                body_text = self.driver.find_elements(By.TAG_NAME, "body")
-                if body_text:
-                    text_content = body_text[0].text.lower()
-                    challenge_keywords = ["select all", "click on", "images", "traffic lights", "crosswalks", "vehicles"]
-                    if any(keyword in text_content for keyword in challenge_keywords):
-                        self.logger.info(f"Found challenge text indicating image challenge")
-                        return True
+                text_content = self.driver.execute_script("return document.body ? document.body.innerText : '';")
+                if _CHALLENGE_TEXT_RE.search(text_content):
+                    self.logger.info("Found challenge text indicating image challenge")
+                    return True
                 
                 return False
                 
@@ -747,90 +1227,47 @@ class IRASScraper:
                 
         except Exception as e:
             self.logger.debug(f"Error detecting image challenge: {str(e)}")
+            self._invalidate_recaptcha_iframes()
             try:
                 self.driver.switch_to.default_content()
             except:
                 pass
             return False
 
+    def _wait_for_recaptcha_solved(self, timeout: float) -> bool:
+        """Poll _verify_recaptcha_solved until it succeeds or timeout expires.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if ReCAPTCHA was solved within timeout, False otherwise
+        """
+        try:
+            return WebDriverWait(
+                self.driver, timeout, poll_frequency=0.5, ignored_exceptions=(WebDriverException,)
+            ).until(lambda driver: self._verify_recaptcha_solved())
+        except TimeoutException:
+            return False
+    
     def _verify_recaptcha_solved(self) -> bool:
         """Verify if ReCAPTCHA has been solved.
         
+        A solved widget always fills its g-recaptcha-response token, so one
+        in-page read of the token lengths replaces iframe switching and
+        page_source scans.
+        
         Returns:
             True if ReCAPTCHA is solved, False otherwise
         """
         try:
-            self.logger.info("Verifying ReCAPTCHA solution...")
-            
-            # Method 1: Check g-recaptcha-response token
-            response_elements = self.driver.find_elements(By.NAME, "g-recaptcha-response")
-            self.logger.info(f"Found {len(response_elements)} g-recaptcha-response elements")
-            
-            if response_elements:
-                response_value = response_elements[0].get_attribute("value")
-                self.logger.info(f"ReCAPTCHA response token length: {len(response_value) if response_value else 0}")
-                if response_value and response_value.strip():
-                    self.logger.info("✓ ReCAPTCHA token found and not empty")
-                    return True
-                else:
-                    self.logger.info("✗ ReCAPTCHA token is empty")
-            
-            # Method 2: Check for ReCAPTCHA checkbox in checked state
-            try:
-                checkbox_iframes = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha/api2/anchor']")
-                self.logger.info(f"Found {len(checkbox_iframes)} checkbox iframes")
-                
-                if checkbox_iframes:
-                    self.driver.switch_to.frame(checkbox_iframes[0])
-                    checkboxes = self.driver.find_elements(By.CSS_SELECTOR, ".recaptcha-checkbox-checked")
-                    checkboxes_checkmark = self.driver.find_elements(By.CSS_SELECTOR, ".recaptcha-checkbox-checkmark")
-                    self.driver.switch_to.default_content()
-                    
-                    self.logger.info(f"Found {len(checkboxes)} checked checkboxes, {len(checkboxes_checkmark)} checkmarks")
-                    
-                    if checkboxes or checkboxes_checkmark:
-                        self.logger.info("✓ ReCAPTCHA checkbox appears to be checked")
-                        return True
-            except Exception as iframe_error:
-                self.logger.debug(f"Error checking iframe checkbox: {iframe_error}")
-                try:
-                    self.driver.switch_to.default_content()
-                except:
-                    pass
-            
-            # Method 3: Look for success indicators in page source
-            page_source = self.driver.page_source.lower()
-            success_patterns = [
-                "recaptcha-success", 
-                "captcha solved", 
-                "verification complete",
-                "recaptcha-checkbox-checked"
-            ]
-            
-            for pattern in success_patterns:
-                if pattern in page_source:
-                    self.logger.info(f"✓ Found success pattern in page source: {pattern}")
-                    return True
-            
-            # Method 4: Check if search can proceed (try clicking search button)
-            try:
-                search_buttons = self.driver.find_elements(By.ID, "btnSearch")
-                if search_buttons and search_buttons[0].is_enabled():
-                    self.logger.info("✓ Search button is enabled - ReCAPTCHA likely solved")
-                    return True
-                elif search_buttons:
-                    self.logger.info("✗ Search button is present but disabled")
-                else:
-                    self.logger.info("✗ Search button not found")
-            except Exception as btn_error:
-                self.logger.debug(f"Error checking search button: {btn_error}")
-            
-            self.logger.info("✗ ReCAPTCHA verification failed - no success indicators found")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error verifying ReCAPTCHA: {str(e)}")
+            tokens = self._cdp_eval(_RECAPTCHA_TOKEN_LENGTHS_JS)
+        except WebDriverException as e:
+            self.logger.debug(f"Error verifying ReCAPTCHA: {str(e)}")
             return False
+        
+        self.logger.debug(f"ReCAPTCHA response token lengths: {tokens}")
+        return any(tokens)
     
     def search_uen(self, uen: str) -> Dict[str, Any]:
         """Search for UEN information on IRAS website.
@@ -849,6 +1286,8 @@ class IRASScraper:
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         
+        self._wait_for_request_slot()
+        
         try:
             self.logger.info(f"Searching for UEN: {uen}")
             
@@ -858,27 +1297,30 @@ class IRASScraper:
                 result["error"] = "Failed to navigate to IRAS website"
                 return result
             
-            # Add debug information about the page
-            debug_info = self._debug_page_elements()
-            self.logger.info(f"Page debug info: {debug_info}")
+            # From here on the page is no longer fresh for the next search
+            self._search_form_used = True
             
-            # Find UEN input field first
-            uen_input = None
-            possible_selectors = [
-                (By.ID, "txtKeyword"),  # Primary IRAS selector
-                (By.CSS_SELECTOR, "input[name*='txtKeyword']"),  # ASP.NET fallback
-                (By.CSS_SELECTOR, "input[placeholder*='UEN']"),  # Generic fallback
-            ]
+            # Add debug information about the page (skipped unless DEBUG is logged)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                debug_info = self._debug_page_elements()
+                self.logger.debug(f"Page debug info: {debug_info}")
             
-            for selector_type, selector_value in possible_selectors:
-                try:
-                    uen_input = self.wait.until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    self.logger.info(f"Found UEN input field using selector: {selector_type}={selector_value}")
-                    break
-                except TimeoutException:
-                    continue
+            # Find UEN input field first; each poll tries the selector that
+            # matched last time, then the rest in priority order
+            input_selectors = _prefer_selector(self._uen_input_selector, _UEN_INPUT_SELECTORS)
+            
+            def find_uen_input(driver):
+                for selector in input_selectors:
+                    elements = driver.find_elements(*selector)
+                    if elements:
+                        return selector, elements[0]
+                return False
+            
+            try:
+                self._uen_input_selector, uen_input = self.wait.until(find_uen_input)
+                self.logger.info(f"Found UEN input field using selector: {self._uen_input_selector[0]}={self._uen_input_selector[1]}")
+            except TimeoutException:
+                self._uen_input_selector = uen_input = None
             
             if not uen_input:
                 result["error"] = "Could not find UEN input field on the page"
@@ -895,21 +1337,16 @@ class IRASScraper:
                 result["error"] = "Failed to solve ReCAPTCHA"
                 return result
             
-            # Find search button (after CAPTCHA is solved)
-            search_button = None
-            search_selectors = [
-                (By.ID, "btnSearch"),  # Primary IRAS selector
-                (By.CSS_SELECTOR, "input[value*='SEARCH']"),  # Value-based fallback
-                (By.CSS_SELECTOR, "input[type='submit']"),  # Generic submit button
-            ]
-            
-            for selector_type, selector_value in search_selectors:
-                try:
-                    search_button = self.driver.find_element(selector_type, selector_value)
-                    self.logger.info(f"Found search button using selector: {selector_type}={selector_value}")
+            # Find search button (after CAPTCHA is solved), last match first
+            button_selectors = _prefer_selector(self._search_button_selector, _SEARCH_BUTTON_SELECTORS)
+            search_button = self._search_button_selector = None
+            for selector in button_selectors:
+                elements = self.driver.find_elements(*selector)
+                if elements:
+                    search_button = elements[0]
+                    self._search_button_selector = selector
+                    self.logger.info(f"Found search button using selector: {selector[0]}={selector[1]}")
                     break
-                except:
-                    continue
             
             if not search_button:
                 result["error"] = "Could not find search button on the page"
@@ -926,13 +1363,20 @@ class IRASScraper:
                     search_button.click()
                     self.logger.info("Successfully clicked search button with fallback method")
                 except Exception as fallback_error:
-                    result["error"] = f"Could not click search button: {str(e)}"
-                    return result            # Wait for results page to load
-            time.sleep(3)
+                    result["error"] = f"Could not click search button: {str(e)} (fallback click: {fallback_error})"
+                    return result
+            
+            # Wait for the results table or a "no records" message
+            try:
+                WebDriverWait(
+                    self.driver, self.config.RESULTS_TIMEOUT, poll_frequency=0.25,
+                    ignored_exceptions=(WebDriverException,)
+                ).until(_results_or_no_records())
+            except TimeoutException:
+                self.logger.warning("Results page did not finish loading; checking current page")
             
             # Check for "No records found" message
-            page_text = self.driver.page_source.lower()
-            if "no records found" in page_text or "record not found" in page_text:
+            if self.driver.execute_script(_NO_RECORDS_JS):
                 result["success"] = True
                 result["data"] = {"status": "No records found"}
                 self.logger.info(f"No records found for UEN: {uen}")
@@ -958,8 +1402,9 @@ class IRASScraper:
             self.logger.error(error_msg)
             result["error"] = error_msg
         
-        # Add random delay between requests
-        self._add_random_delay()
+        finally:
+            # Space out the next search on every outcome instead of sleeping here
+            self._schedule_next_request()
         
         return result
     
@@ -972,18 +1417,18 @@ class IRASScraper:
         data = {}
         
         try:
-            # Wait for results table/container to load
-            time.sleep(2)
-            
             # Try to find results table or data container
             results_container = None
-            container_selectors = [
-                (By.ID, "dgResults"),  # Primary IRAS results table
-                (By.CSS_SELECTOR, "table[id*='result']"),  # Generic results table
-                (By.TAG_NAME, "table"),  # Any table fallback
-            ]
             
-            for selector_type, selector_value in container_selectors:
+            # Wait for results table/container to load
+            try:
+                WebDriverWait(self.driver, self.config.ELEMENT_WAIT_TIMEOUT).until(
+                    lambda driver: any(driver.find_elements(*selector) for selector in _RESULTS_CONTAINER_SELECTORS)
+                )
+            except TimeoutException:
+                self.logger.debug("No results container appeared within timeout")
+            
+            for selector_type, selector_value in _RESULTS_CONTAINER_SELECTORS:
                 try:
                     results_container = self.driver.find_element(selector_type, selector_value)
                     self.logger.info(f"Found results container using: {selector_type}={selector_value}")
@@ -992,43 +1437,9 @@ class IRASScraper:
                     continue
             
             if results_container:
-                # Extract all visible text from the results area
-                results_text = results_container.text.strip()
-                data["raw_results"] = results_text
-                
-                # Extract key IRAS fields
-                field_mappings = {
-                    "uen": ["uen"],
-                    "status": ["status"],
-                    "gst_registration": ["gst"],
-                }
-                
-                # Try to extract structured data from table rows
-                try:
-                    rows = results_container.find_elements(By.TAG_NAME, "tr")
-                    for row in rows:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        if len(cells) >= 2:
-                            field_name = cells[0].text.strip().lower()
-                            field_value = cells[1].text.strip()
-                            
-                            # Map field names to our standard names
-                            for standard_name, possible_names in field_mappings.items():
-                                for possible_name in possible_names:
-                                    if possible_name in field_name:
-                                        data[standard_name] = field_value
-                                        break
-                except Exception as e:
-                    self.logger.debug(f"Could not extract structured table data: {str(e)}")
-                
-                # Simple pattern matching for key fields
-                if not any(key != "raw_results" for key in data.keys()):
-                    lines = results_text.split('\n')
-                    for line in lines:
-                        if "not registered" in line.lower():
-                            data["gst_registration"] = "Not registered"
-                        elif "registered" in line.lower() and "from" in line.lower():
-                            data["gst_registration"] = "Registered"
+                # Container text and every row's cells in one round-trip
+                found = self.driver.execute_script(_RESULTS_TABLE_JS, results_container)
+                data.update(_parse_results(found["text"], found["rows"]))
             
             # Mark extraction status
             if len(data) > 0:
@@ -1049,49 +1460,93 @@ class IRASScraper:
         
         return data
     
-    def _add_random_delay(self):
-        """Add random delay between requests to avoid detection."""
+    def _jitter_delay(self, low: float, high: float) -> float:
+        """Pick a human-like pause in [low, high] seconds, scaled by JITTER_SCALE."""
+        return random.uniform(low, high) * self.config.JITTER_SCALE
+    
+    def _jitter(self, low: float, high: float):
+        """Sleep for a human-like pause in [low, high] seconds, scaled by JITTER_SCALE."""
+        time.sleep(self._jitter_delay(low, high))
+    
+    def _request_spacing(self) -> float:
+        """Pick the pause between searches: a RANDOM_DELAY_RANGE jitter with REQUEST_DELAY as its floor."""
         delay_min, delay_max = self.config.RANDOM_DELAY_RANGE
-        delay = random.uniform(delay_min, delay_max)
-        self.logger.debug(f"Adding random delay of {delay:.2f} seconds")
-        time.sleep(delay)
+        return max(self.config.REQUEST_DELAY, self._jitter_delay(delay_min, delay_max))
+    
+    def _schedule_next_request(self):
+        """Set the earliest start of the next search to avoid detection.
+        
+        The spacing is counted from now; time spent before the next
+        search_uen call counts towards it.
+        """
+        self._request_schedule.finished(self._request_spacing())
+    
+    def _wait_for_request_slot(self):
+        """Sleep only for whatever is left of the spacing after the previous search."""
+        remaining = self._request_schedule.reserve(self._request_spacing())
+        if remaining > 0:
+            self.logger.debug(f"Waiting {remaining:.2f}s before next request")
+            time.sleep(remaining)
     
     def _save_debug_screenshot(self, filename_suffix: str):
-        """Save a debug screenshot."""
+        """Save a debug screenshot when DEBUG_SCREENSHOTS is enabled.
+        
+        The PNG is captured synchronously but written to disk on a
+        background thread so CAPTCHA polling is not held up by file I/O.
+        """
+        if not self.config.DEBUG_SCREENSHOTS:
+            return
         try:
-            import os
-            os.makedirs("logs/screenshots", exist_ok=True)
             timestamp = int(time.time())
-            filename = f"logs/screenshots/{filename_suffix}_{timestamp}.png"
-            self.driver.save_screenshot(filename)
-            self.logger.debug(f"Debug screenshot saved: {filename}")
+            path = SCREENSHOT_DIR / f"{filename_suffix}_{timestamp}.png"
+            png = self.driver.get_screenshot_as_png()
+            if self._screenshot_pool is None:
+                self._screenshot_pool = ThreadPoolExecutor(max_workers=1)
+            self._screenshot_pool.submit(_write_screenshot, path, png)
+            self.logger.debug(f"Debug screenshot queued: {path}")
         except Exception as e:
             self.logger.debug(f"Could not save debug screenshot: {str(e)}")
     
     def _debug_page_elements(self) -> Dict[str, Any]:
-        """Debug helper to inspect page elements."""
+        """Debug helper to inspect page elements (one CDP call)."""
         try:
-            return {
-                "page_title": self.driver.title,
-                "page_url": self.driver.current_url,
-                "has_txtKeyword": bool(self.driver.find_elements(By.ID, "txtKeyword")),
-                "has_btnSearch": bool(self.driver.find_elements(By.ID, "btnSearch")),
-                "has_recaptcha_frames": len(self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha']")),
-                "has_recaptcha_containers": len(self.driver.find_elements(By.CSS_SELECTOR, ".g-recaptcha"))
-            }
+            return self._cdp_eval(_DEBUG_PAGE_JS)
         except Exception as e:
             return {"debug_error": str(e)}
     
     def scrape_multiple_uens(self, uens: List[str]) -> List[Dict[str, Any]]:
         """Scrape multiple UENs with optimized session reuse.
         
+        Runs PARALLEL_WORKERS pooled drivers at once when it is above 1.
+        
         Args:
             uens: List of UEN numbers to scrape
             
         Returns:
-            List of results for each UEN
+            List of results for each UEN, in input order
         """
-        results = []
+        if self.config.PARALLEL_WORKERS > 1:
+            return self.scrape_multiple_uens_parallel(uens, self.config.PARALLEL_WORKERS)
+        return list(self.iter_scrape_uens(uens))
+    
+    def iter_scrape_uens(self, uens: List[str]) -> Iterator[Dict[str, Any]]:
+        """Scrape multiple UENs in one session, yielding each result as it completes.
+        
+        The session is closed when the generator is exhausted or closed, so
+        callers can write results out while scraping continues. With
+        PARALLEL_WORKERS above 1, UENs are spread over that many pooled
+        drivers instead.
+        
+        Args:
+            uens: List of UEN numbers to scrape
+            
+        Yields:
+            Result dictionary for each UEN, in input order
+        """
+        if self.config.PARALLEL_WORKERS > 1:
+            yield from self._iter_scrape_uens_parallel(uens, self.config.PARALLEL_WORKERS)
+            return
+        
         session_initialized = False
         
         try:
@@ -1101,7 +1556,7 @@ class IRASScraper:
             # Navigate to IRAS once and reuse the session
             if not self.navigate_to_iras():
                 self.logger.error("Failed to navigate to IRAS website")
-                return results
+                return
             
             # CAPTCHA will be solved per-UEN as needed (not upfront)
             
@@ -1109,7 +1564,6 @@ class IRASScraper:
                 self.logger.info(f"Processing UEN {i}/{len(uens)}: {uen}")
                 
                 result = self.search_uen(uen)
-                results.append(result)
                 
                 # Log progress
                 if result["success"]:
@@ -1117,9 +1571,7 @@ class IRASScraper:
                 else:
                     self.logger.warning(f"✗ UEN {uen} failed: {result['error']}")
                 
-                # Minimal delay between UENs for speed
-                if i < len(uens):  # Don't delay after the last UEN
-                    time.sleep(self.config.REQUEST_DELAY)
+                yield result
             
         except Exception as e:
             self.logger.error(f"Error in batch scraping: {str(e)}")
@@ -1127,5 +1579,158 @@ class IRASScraper:
         finally:
             if session_initialized:
                 self.close_session()
+    
+    def scrape_multiple_uens_parallel(self, uens: List[str], concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Scrape multiple UENs concurrently, one pooled driver per worker.
+        
+        Each worker thread borrows a driver from the browser pool (this
+        scraper's pool, or a temporary one sized to ``concurrency``), runs
+        ``search_uen`` and returns the driver for the next UEN.
+        
+        Args:
+            uens: List of UEN numbers to scrape
+            concurrency: Number of UENs processed at the same time
+            
+        Returns:
+            List of results for each UEN, in input order
+        """
+        return list(self._iter_scrape_uens_parallel(uens, concurrency))
+    
+    def _iter_scrape_uens_parallel(self, uens: List[str], concurrency: int) -> Iterator[Dict[str, Any]]:
+        """Scrape UENs on pooled drivers, yielding results in input order.
+        
+        Queued UENs are cancelled when the generator is closed early (e.g.
+        Ctrl+C), so only the searches already running are waited for.
+        
+        Args:
+            uens: List of UEN numbers to scrape
+            concurrency: Number of UENs processed at the same time
+            
+        Yields:
+            Result dictionary for each UEN once it and every earlier UEN finished
+        """
+        pool = self.pool or BrowserPool(self.config, size=concurrency)
         
-        return results
\ No newline at end of file
+        self.logger.info(f"Processing {len(uens)} UENs with {concurrency} parallel workers")
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(self._scrape_with_pool, uen, pool) for uen in uens]
+                try:
+                    for future in futures:
+                        yield future.result()
+                finally:
+                    # Cancel before the executor exit waits on the queued UENs
+                    for future in futures:
+                        future.cancel()
+        finally:
+            if pool is not self.pool:
+                pool.close()
+    
+    def _scrape_with_pool(self, uen: str, pool: BrowserPool) -> Dict[str, Any]:
+        """Scrape one UEN in its own session on a driver borrowed from pool."""
+        worker = IRASScraper(self.config, pool=pool)
+        # Pace the workers' searches together rather than each on its own
+        worker._request_schedule = self._request_schedule
+        try:
+            worker.start_session()
+        except Exception as e:
+            return {
+                "uen": uen,
+                "success": False,
+                "data": {},
+                "error": f"Failed to start session: {str(e)}",
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+        
+        try:
+            result = worker.search_uen(uen)
+        finally:
+            worker.close_session()
+        
+        if result["success"]:
+            self.logger.info(f"✓ UEN {uen} processed successfully")
+        else:
+            self.logger.warning(f"✗ UEN {uen} failed: {result['error']}")
+        return result
+    
+    @classmethod
+    def run_batch(cls, uens: List[str], workers: int = 4, config: Config = None) -> List[Dict[str, Any]]:
+        """Scrape multiple UENs across worker processes, one Chrome per process.
+        
+        Each worker process keeps a single scraper session open and reuses it
+        for every UEN it is handed, so WebDriver is never shared between
+        threads; a session whose browser dies is restarted. Worker start-up
+        is staggered to avoid launching all Chrome instances (and
+        ChromeDriver downloads) at the same moment, and searches are paced
+        across all processes as they are for a single scraper.
+        
+        Args:
+            uens: List of UEN numbers to scrape
+            workers: Number of worker processes
+            config: Configuration for the worker scrapers (uses default if None)
+            
+        Returns:
+            List of results for each UEN, in input order
+        """
+        config = config or Config()
+        # Next search start time (time.monotonic()) shared by every worker
+        next_request_time = multiprocessing.Value('d', 0.0)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(config, 0.5 * workers, next_request_time)
+        ) as executor:
+            return list(executor.map(_batch_worker, uens))
+
+
+# Configuration and shared request pacing for a run_batch worker process
+_batch_config: Optional[Config] = None
+_batch_request_schedule: Optional[_RequestSchedule] = None
+
+
+def _init_batch_worker(config: Config, max_stagger: float, next_request_time):
+    """Store the worker configuration and pacing, and stagger process start-up."""
+    global _batch_config, _batch_request_schedule
+    _batch_config = config
+    _batch_request_schedule = _RequestSchedule(next_request_time)
+    time.sleep(random.uniform(0, max_stagger))
+
+
+@functools.lru_cache(maxsize=1)
+def _batch_scraper() -> IRASScraper:
+    """Start this worker process's scraper session on first use."""
+    scraper = IRASScraper(_batch_config)
+    scraper._request_schedule = _batch_request_schedule
+    scraper.start_session()
+    # Quit Chrome when the worker process exits
+    multiprocessing.util.Finalize(scraper, scraper.close_session, exitpriority=10)
+    return scraper
+
+
+def _batch_worker(uen: str) -> Dict[str, Any]:
+    """Scrape one UEN with the worker process's scraper.
+    
+    If the search fails because Chrome died, the session is restarted and
+    the UEN retried once, so one crash does not fail every remaining UEN.
+    """
+    for attempt in range(2):
+        try:
+            scraper = _batch_scraper()
+        except Exception as e:
+            return {
+                "uen": uen,
+                "success": False,
+                "data": {},
+                "error": f"Failed to start session: {str(e)}",
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+        
+        result = scraper.search_uen(uen)
+        if result["success"] or (scraper.driver is not None and BrowserPool._is_alive(scraper.driver)):
+            return result
+        
+        scraper.logger.warning(f"Browser session lost while searching {uen}, restarting it")
+        scraper.close_session()
+        _batch_scraper.cache_clear()
+    
+    return result
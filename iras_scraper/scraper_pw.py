@@ -0,0 +1,344 @@
+"""Playwright backend for the IRAS scraper.
+
+Concurrent searches run as isolated browser contexts inside one Chromium
+process instead of one Chrome/ChromeDriver pair per worker.
+"""
+
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Any, List, Tuple
+
+from selenium.webdriver.common.by import By
+
+# Optional import for the Playwright backend
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+from .config import Config
+from .scraper import (
+    IRASScraper,
+    RECAPTCHA_SOLVER_AVAILABLE,
+    RECAPTCHA_PRESENCE_TIMEOUT,
+    RECAPTCHA_ANCHOR_SELECTOR,
+    _PAGE_SCRIPTS_JS,
+    _HEADLESS_PAGE_SCRIPTS_JS,
+    _UEN_INPUT_SELECTORS,
+    _SEARCH_BUTTON_SELECTORS,
+    _RESULTS_CONTAINER_SELECTORS,
+    _RESULTS_TABLE_FN,
+    _NO_RECORDS_TEST,
+    _RequestSchedule,
+    _parse_results,
+)
+
+# Error reported when the checkbox click alone did not solve the ReCAPTCHA
+RECAPTCHA_FAILED_ERROR = "Failed to solve ReCAPTCHA"
+
+# Checkbox inside the ReCAPTCHA anchor iframe
+_ANCHOR_CHECKBOX_SELECTOR = "#recaptcha-anchor"
+
+
+def _selector(locator: Tuple[str, str]) -> str:
+    """Convert a Selenium (By, value) locator into a Playwright selector."""
+    by, value = locator
+    if by == By.ID:
+        return f"#{value}"
+    if by == By.XPATH:
+        return f"xpath={value}"
+    return value
+
+
+# Search form locators as single grouped Playwright selectors
+_UEN_INPUT_SELECTOR = ", ".join(_selector(s) for s in _UEN_INPUT_SELECTORS)
+_SEARCH_BUTTON_SELECTOR = ", ".join(_selector(s) for s in _SEARCH_BUTTON_SELECTORS)
+
+
+class PlaywrightIRASScraper:
+    """Async IRAS scraper sharing one Chromium process between searches.
+
+    Mirrors the IRASScraper interface with coroutines. Each search gets its
+    own browser context (separate cookies and ReCAPTCHA state) and up to
+    ``concurrency`` searches run at once. The audio ReCAPTCHA solver only
+    drives Selenium, so searches whose checkbox click does not clear the
+    ReCAPTCHA are retried through IRASScraper when the solver is installed.
+    """
+
+    def __init__(self, config: Config = None, concurrency: int = 4):
+        """Initialize the Playwright scraper.
+
+        Args:
+            config: Configuration object (uses default if None)
+            concurrency: Number of searches (browser contexts) run at once
+        """
+        self.config = config or Config()
+        self.concurrency = concurrency
+        self.logger = logging.getLogger(__name__)
+
+        self._playwright = None
+        self.browser = None
+        self._semaphore = None
+        # Spaces out search starts across all contexts, like IRASScraper
+        self._request_schedule = _RequestSchedule()
+
+    async def start_session(self):
+        """Launch the shared Chromium browser."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise ImportError("playwright not available. Install with: uv sync --extra playwright")
+
+        self._playwright = await async_playwright().start()
+        try:
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.config.HEADLESS,
+                args=list(self.config.CHROME_OPTIONS),
+                ignore_default_args=["--enable-automation"]
+            )
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.logger.info("Playwright Chromium session started")
+
+    async def close_session(self):
+        """Close the browser and stop Playwright."""
+        try:
+            if self.browser:
+                await self.browser.close()
+                self.logger.info("Playwright browser closed")
+        except Exception as e:
+            self.logger.warning(f"Error closing Playwright browser: {str(e)}")
+        finally:
+            self.browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def __aenter__(self):
+        await self.start_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_session()
+
+    async def _new_context(self):
+        """Create an isolated browser context with the stealth page scripts."""
+        width, height = (int(size) for size in self.config.WINDOW_SIZE.split(','))
+        context = await self.browser.new_context(
+            user_agent=random.choice(self.config.USER_AGENTS),
+            viewport={"width": width, "height": height}
+        )
+        context.set_default_timeout(self.config.ELEMENT_WAIT_TIMEOUT * 1000)
+        context.set_default_navigation_timeout(self.config.PAGE_LOAD_TIMEOUT * 1000)
+        await context.add_init_script(
+            _HEADLESS_PAGE_SCRIPTS_JS if self.config.HEADLESS else _PAGE_SCRIPTS_JS
+        )
+        return context
+
+    async def navigate_to_iras(self, page) -> bool:
+        """Open the IRAS search page.
+
+        Args:
+            page: Playwright page to navigate
+
+        Returns:
+            True if navigation successful, False otherwise
+        """
+        try:
+            self.logger.info(f"Navigating to IRAS website: {self.config.IRAS_URL}")
+            await page.goto(self.config.IRAS_URL, wait_until="domcontentloaded")
+            return True
+        except PlaywrightTimeoutError:
+            self.logger.error("Timeout while loading IRAS website")
+            return False
+        except Exception as e:
+            self.logger.error(f"Error navigating to IRAS website: {str(e)}")
+            return False
+
+    async def solve_recaptcha(self, page) -> bool:
+        """Click the ReCAPTCHA checkbox and wait for a response token.
+
+        Args:
+            page: Playwright page showing the IRAS search form
+
+        Returns:
+            True if there is no ReCAPTCHA or it was solved, False otherwise
+        """
+        try:
+            try:
+                await page.wait_for_selector(
+                    RECAPTCHA_ANCHOR_SELECTOR, state="attached",
+                    timeout=RECAPTCHA_PRESENCE_TIMEOUT * 1000
+                )
+            except PlaywrightTimeoutError:
+                self.logger.info("No ReCAPTCHA found on page")
+                return True
+
+            if not self.config.RECAPTCHA_AUTO_SOLVE:
+                self.logger.warning("ReCAPTCHA detected but auto-solving disabled. Manual intervention required.")
+                return False
+
+            await asyncio.sleep(random.uniform(0.5, 2.0) * self.config.JITTER_SCALE)
+            await page.frame_locator(RECAPTCHA_ANCHOR_SELECTOR).locator(_ANCHOR_CHECKBOX_SELECTOR).click()
+
+            try:
+                await page.wait_for_function(
+                    "() => window.__findRecaptcha().tokens.some(length => length > 0)",
+                    timeout=3000
+                )
+            except PlaywrightTimeoutError:
+                self.logger.info("ReCAPTCHA checkbox click raised a challenge")
+                return False
+
+            self.logger.info("ReCAPTCHA solved with checkbox click")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error solving ReCAPTCHA: {str(e)}")
+            return False
+
+    def _request_spacing(self) -> float:
+        """Pick the pause between searches: a RANDOM_DELAY_RANGE jitter with REQUEST_DELAY as its floor."""
+        delay_min, delay_max = self.config.RANDOM_DELAY_RANGE
+        return max(self.config.REQUEST_DELAY, random.uniform(delay_min, delay_max) * self.config.JITTER_SCALE)
+
+    async def search_uen(self, uen: str) -> Dict[str, Any]:
+        """Search for UEN information in a fresh browser context.
+
+        Args:
+            uen: UEN number to search for
+
+        Returns:
+            Dictionary containing search results or error information
+        """
+        result = {
+            "uen": uen,
+            "success": False,
+            "data": {},
+            "error": None,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        async with self._semaphore:
+            await asyncio.sleep(self._request_schedule.reserve(self._request_spacing()))
+            context = await self._new_context()
+            try:
+                page = await context.new_page()
+
+                if not await self.navigate_to_iras(page):
+                    result["error"] = "Failed to navigate to IRAS website"
+                    return result
+
+                uen_input = page.locator(_UEN_INPUT_SELECTOR).first
+                await uen_input.fill(uen)
+
+                if not await self.solve_recaptcha(page):
+                    result["error"] = RECAPTCHA_FAILED_ERROR
+                    return result
+
+                search_button = page.locator(_SEARCH_BUTTON_SELECTOR).first
+                async with page.expect_navigation(wait_until="domcontentloaded"):
+                    await search_button.click()
+
+                # Same "no records" check as the Selenium backend
+                if await page.evaluate(_NO_RECORDS_TEST):
+                    result["success"] = True
+                    result["data"] = {"status": "No records found"}
+                    self.logger.info(f"No records found for UEN: {uen}")
+                    return result
+
+                extracted_data = await self._extract_search_results(page)
+                if extracted_data:
+                    result["success"] = True
+                    result["data"] = extracted_data
+                    self.logger.info(f"Successfully retrieved data for UEN: {uen}")
+                else:
+                    result["error"] = "Could not extract data from results page"
+
+            except PlaywrightTimeoutError:
+                error_msg = f"Timeout while searching for UEN: {uen}"
+                self.logger.error(error_msg)
+                result["error"] = error_msg
+
+            except Exception as e:
+                error_msg = f"Error searching for UEN {uen}: {str(e)}"
+                self.logger.error(error_msg)
+                result["error"] = error_msg
+
+            finally:
+                await context.close()
+                self._request_schedule.finished(self._request_spacing())
+
+        return result
+
+    async def _extract_search_results(self, page) -> Dict[str, str]:
+        """Extract search results from the results page.
+
+        Returns:
+            Dictionary containing extracted data
+        """
+        for locator in _RESULTS_CONTAINER_SELECTORS:
+            container = await page.query_selector(_selector(locator))
+            if container:
+                self.logger.info(f"Found results container using: {locator[0]}={locator[1]}")
+                found = await container.evaluate(_RESULTS_TABLE_FN)
+                data = _parse_results(found["text"], found["rows"])
+                data["extraction_status"] = "success"
+                return data
+
+        return {"extraction_status": "no_data_found"}
+
+    async def scrape_multiple_uens(self, uens: List[str]) -> List[Dict[str, Any]]:
+        """Scrape multiple UENs concurrently in one browser.
+
+        UENs that failed only because of a ReCAPTCHA challenge are retried
+        in a single Selenium session when the audio solver is installed.
+
+        Args:
+            uens: List of UEN numbers to scrape
+
+        Returns:
+            List of results for each UEN, in input order
+        """
+        self.logger.info(f"Processing {len(uens)} UENs with {self.concurrency} browser contexts")
+        async with self:
+            results = await asyncio.gather(*(self.search_uen(uen) for uen in uens))
+
+        retry = [i for i, result in enumerate(results) if result["error"] == RECAPTCHA_FAILED_ERROR]
+        if retry and RECAPTCHA_SOLVER_AVAILABLE:
+            self.logger.info(f"Retrying {len(retry)} ReCAPTCHA challenges with the Selenium solver")
+            fallback = IRASScraper(self.config)
+            retried = await asyncio.get_running_loop().run_in_executor(
+                None, fallback.scrape_multiple_uens, [uens[i] for i in retry]
+            )
+            # Match retried results by UEN: the fallback may stop early and
+            # return fewer results than it was given
+            retried_by_uen = {}
+            for result in retried:
+                retried_by_uen.setdefault(result["uen"], []).append(result)
+            for i in retry:
+                pending = retried_by_uen.get(uens[i])
+                if pending:
+                    results[i] = pending.pop(0)
+                else:
+                    self.logger.warning(f"Selenium fallback returned no result for UEN: {uens[i]}")
+
+        return list(results)
+
+    @classmethod
+    def run_batch(cls, uens: List[str], concurrency: int = 4, config: Config = None) -> List[Dict[str, Any]]:
+        """Synchronous entry point: scrape UENs with the Playwright backend.
+
+        Args:
+            uens: List of UEN numbers to scrape
+            concurrency: Number of searches run at once
+            config: Configuration for the scraper (uses default if None)
+
+        Returns:
+            List of results for each UEN, in input order
+        """
+        return asyncio.run(cls(config, concurrency).scrape_multiple_uens(uens))
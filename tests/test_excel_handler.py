@@ -0,0 +1,110 @@
+"""Tests for Excel input reading and result writing."""
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from iras_scraper import excel_handler
+from iras_scraper.excel_handler import ExcelHandler
+
+
+@pytest.fixture(params=[True, False], ids=["calamine", "openpyxl"])
+def reader(request, monkeypatch):
+    """Run a test with and without the calamine reader."""
+    if request.param and not excel_handler.CALAMINE_AVAILABLE:
+        pytest.skip("python-calamine not installed")
+    monkeypatch.setattr(excel_handler, "CALAMINE_AVAILABLE", request.param)
+    return request.param
+
+
+def _sheet_rows(path):
+    """Return every cell value of the first sheet in path."""
+    workbook = load_workbook(path)
+    try:
+        return [[cell.value for cell in row] for row in workbook.worksheets[0].iter_rows()]
+    finally:
+        workbook.close()
+
+
+@pytest.mark.unit
+class TestExcelHandler:
+    """Test ExcelHandler reading and writing."""
+
+    def test_first_sheet_read_when_not_active(self, temp_excel_file, reader):
+        """Validation and reading both use the first sheet, not the active one."""
+        workbook = Workbook()
+        uen_sheet = workbook.active
+        uen_sheet.append(["UEN"])
+        uen_sheet.append(["AAA"])
+        uen_sheet.append(["BBB"])
+        notes = workbook.create_sheet("Notes")
+        notes.append(["Comment"])
+        workbook.active = 1
+        workbook.save(temp_excel_file)
+
+        handler = ExcelHandler(temp_excel_file, "unused.xlsx")
+
+        assert handler.validate_input_file() is True
+        # Validation fills the parse cache that read_uens() then reuses
+        assert handler._input_cache is not None
+        assert handler.read_uens() == ["AAA", "BBB"]
+
+    def test_validate_header_only_sheet(self, temp_excel_file, reader):
+        """A sheet with a header but no data rows fails validation."""
+        workbook = Workbook()
+        workbook.active.append(["UEN"])
+        workbook.save(temp_excel_file)
+
+        assert ExcelHandler(temp_excel_file, "unused.xlsx").validate_input_file() is False
+
+    def test_expand_none_and_non_dict_data(self):
+        """None and non-dict data go to data_raw; a missing key counts as a dict."""
+        results = [
+            {"uen": "1", "success": True},
+            {"uen": "2", "data": None},
+            {"uen": "3", "data": "unexpected"},
+        ]
+
+        df = ExcelHandler("unused.xlsx", "unused.xlsx")._expand_data_columns(results)
+
+        assert df.loc[0, "business_status"] == ""
+        assert df.loc[1, "data_raw"] == ""
+        assert df.loc[2, "data_raw"] == "unexpected"
+
+    def test_expand_without_dict_data(self):
+        """A batch without dict data gets no key data columns."""
+        df = ExcelHandler("unused.xlsx", "unused.xlsx")._expand_data_columns(
+            [{"uen": "1", "data": "text"}]
+        )
+
+        assert "business_status" not in df.columns
+        assert list(df["data_raw"]) == ["text"]
+
+    def test_stream_matches_write_results(self, tmp_path, sample_scraper_results):
+        """Streamed output has the same cells as write_results, extras included."""
+        results = sample_scraper_results + [
+            {"uen": "3", "success": True, "data": {"status": "Live", "uen": "3X"}},
+            {"uen": "4", "success": False, "data": "raw page"},
+            {"uen": "5", "success": None, "data": None},
+        ]
+        batch_file = tmp_path / "batch.xlsx"
+        stream_file = tmp_path / "stream.xlsx"
+
+        ExcelHandler("unused.xlsx", batch_file).write_results(results)
+        written = ExcelHandler("unused.xlsx", stream_file).write_results_stream(iter(results))
+
+        assert written == len(results)
+        assert _sheet_rows(stream_file) == _sheet_rows(batch_file)
+        assert "data_uen" in _sheet_rows(stream_file)[0]
+
+    def test_append_without_results_sheet(self, tmp_path, sample_scraper_results):
+        """Appending to a file without the results sheet uses its first sheet."""
+        output_file = tmp_path / "output.xlsx"
+        workbook = Workbook()
+        workbook.active.title = "Sheet1"
+        workbook.save(output_file)
+
+        ExcelHandler("unused.xlsx", output_file).append_results(sample_scraper_results)
+
+        rows = _sheet_rows(output_file)
+        assert rows[0][0] is not None
+        assert len(rows) == len(sample_scraper_results) + 1
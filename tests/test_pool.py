@@ -0,0 +1,133 @@
+"""Tests for the browser pool, using fake drivers instead of Chrome."""
+
+import queue
+import threading
+
+import pytest
+
+from iras_scraper.pool import BrowserPool
+
+
+class FakeDriver:
+    """Stand-in for a Chrome WebDriver with the calls BrowserPool makes."""
+
+    def __init__(self):
+        self.session_id = "session"
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            from selenium.common.exceptions import WebDriverException
+            raise WebDriverException("session lost")
+        return "about:blank"
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeBrowserPool(BrowserPool):
+    """BrowserPool that hands out FakeDrivers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created = []
+
+    def _create_driver(self):
+        driver = FakeDriver()
+        self._uses[id(driver)] = 0
+        self.created.append(driver)
+        return driver
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    """Test acquire/release/discard bookkeeping."""
+
+    def test_release_reuses_driver(self):
+        """A released driver is handed out again instead of a new one."""
+        pool = FakeBrowserPool(size=2, max_uses=10)
+
+        driver = pool.acquire()
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert len(pool.created) == 1
+
+    def test_discard_frees_slot(self):
+        """Discarding quits the driver and lets a new one be created."""
+        pool = FakeBrowserPool(size=1, max_uses=10)
+
+        driver = pool.acquire()
+        pool.release(driver, discard=True)
+
+        assert driver.quit_called
+        assert pool._created == 0
+        assert pool.acquire() is not driver
+        assert len(pool.created) == 2
+
+    def test_recycle_after_max_uses(self):
+        """A driver is quit once it has served max_uses sessions."""
+        pool = FakeBrowserPool(size=1, max_uses=2)
+
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert pool._created == 0
+
+    def test_dead_idle_driver_replaced(self):
+        """An idle driver whose session died is quit and replaced."""
+        pool = FakeBrowserPool(size=1, max_uses=10)
+
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.alive = False
+
+        replacement = pool.acquire()
+        assert replacement is not driver
+        assert driver.quit_called
+
+    def test_acquire_timeout_when_full(self):
+        """acquire() raises queue.Empty when the pool stays full."""
+        pool = FakeBrowserPool(size=1, max_uses=10)
+        pool.acquire()
+
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.1)
+
+    def test_waiter_woken_by_discard(self):
+        """A blocked acquire() gets a new driver when the busy one is discarded."""
+        pool = FakeBrowserPool(size=1, max_uses=10)
+        driver = pool.acquire()
+
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+        waiter.start()
+        pool.release(driver, discard=True)
+        waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+        assert acquired and acquired[0] is not driver
+        assert pool._created == 1
+
+    def test_close_quits_idle_drivers(self):
+        """close() quits every idle driver and frees their slots."""
+        pool = FakeBrowserPool(size=2, max_uses=10)
+        drivers = [pool.acquire(), pool.acquire()]
+        for driver in drivers:
+            pool.release(driver)
+
+        pool.close()
+
+        assert all(driver.quit_called for driver in drivers)
+        assert pool._created == 0
@@ -0,0 +1,128 @@
+"""Tests for scraper helpers that need no browser."""
+
+import time
+import logging
+import threading
+import multiprocessing
+
+import pytest
+
+from iras_scraper.config import Config
+from iras_scraper.scraper import IRASScraper, _RequestSchedule, _parse_results
+
+
+@pytest.mark.unit
+class TestParseResults:
+    """Test mapping of results-table rows onto result fields."""
+
+    def test_gst_label_fills_gst_and_status(self):
+        """A "GST Registration Status" row fills both fields it matches."""
+        rows = [
+            ["GST Registration Status", "Registered"],
+            ["Status", "Live"],
+            ["UEN", "200012345A"],
+        ]
+
+        data = _parse_results("raw text", rows)
+
+        assert data == {
+            "raw_results": "raw text",
+            "gst_registration": "Registered",
+            "status": "Live",
+            "uen": "200012345A",
+        }
+
+    def test_unmatched_rows_ignored(self):
+        """Rows whose label matches no alias are not copied into the result."""
+        data = _parse_results("text", [["Company Name", "Test Pte Ltd"]])
+
+        assert data == {"raw_results": "text"}
+
+    def test_raw_text_fallback(self):
+        """Without table rows, registration status is read from the raw text."""
+        registered = _parse_results("GST registered from 01/01/2020", [])
+        not_registered = _parse_results("This business is not registered", [])
+
+        assert registered["gst_registration"] == "Registered"
+        assert not_registered["gst_registration"] == "Not registered"
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log file for scrapers under test, with their handlers removed afterwards."""
+    logger = logging.getLogger("iras_scraper.scraper")
+    handlers = list(logger.handlers)
+    yield tmp_path / "scraper.log"
+    for handler in logger.handlers[:]:
+        if handler not in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+class StubScraper(IRASScraper):
+    """IRASScraper whose pooled searches only sleep and record the UEN."""
+
+    def __init__(self, log_file, delay: float = 0.2):
+        super().__init__(Config(LOG_FILE=str(log_file)), pool=object())
+        self.delay = delay
+        self.scraped = []
+        self._scraped_lock = threading.Lock()
+
+    def _scrape_with_pool(self, uen, pool):
+        time.sleep(self.delay)
+        with self._scraped_lock:
+            self.scraped.append(uen)
+        return {"uen": uen, "success": True, "data": {}, "error": None}
+
+
+@pytest.mark.unit
+class TestParallelScraping:
+    """Test the thread-pool batch runner with a stub scraper."""
+
+    def test_results_in_input_order(self, log_file):
+        """Results come back in input order whatever order workers finish in."""
+        scraper = StubScraper(log_file, delay=0.05)
+        uens = [f"UEN{i}" for i in range(6)]
+
+        results = scraper.scrape_multiple_uens_parallel(uens, concurrency=3)
+
+        assert [result["uen"] for result in results] == uens
+
+    def test_close_cancels_queued_uens(self, log_file):
+        """Closing the generator early skips UENs that had not started."""
+        scraper = StubScraper(log_file, delay=0.2)
+        uens = [f"UEN{i}" for i in range(10)]
+
+        results = scraper._iter_scrape_uens_parallel(uens, concurrency=2)
+        assert next(results)["uen"] == "UEN0"
+        results.close()
+
+        # Only the searches already running when the generator closed finish
+        assert len(scraper.scraped) <= 4
+
+
+@pytest.mark.unit
+class TestRequestSchedule:
+    """Test request spacing shared between scrapers."""
+
+    def test_reserve_spaces_consecutive_starts(self):
+        """Each reserved start is at least spacing seconds after the previous one."""
+        schedule = _RequestSchedule()
+
+        assert schedule.reserve(1.0) == 0
+        assert schedule.reserve(1.0) == pytest.approx(1.0, abs=0.05)
+
+    def test_finished_pushes_next_start(self):
+        """A finished search delays the next start by spacing from now."""
+        schedule = _RequestSchedule()
+        schedule.finished(0.5)
+
+        assert schedule.reserve(0.0) == pytest.approx(0.5, abs=0.05)
+
+    def test_shared_value_paces_schedules_together(self):
+        """Schedules built on one shared Value space out each other's starts."""
+        next_time = multiprocessing.Value("d", 0.0)
+        first, second = _RequestSchedule(next_time), _RequestSchedule(next_time)
+
+        assert first.reserve(1.0) == 0
+        assert second.reserve(1.0) == pytest.approx(1.0, abs=0.05)